@@ -20,11 +20,11 @@ def load_json_file(file_path: Path) -> Dict[str, Any]:
         FileNotFoundError: If file does not exist
         json.JSONDecodeError: If file contains invalid JSON
     """
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    with open(file_path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    try:
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"File not found: {file_path}") from None
 
 
 def create_jinja_env() -> Environment:
@@ -155,10 +155,10 @@ def determine_profile_version(existing_profile_path: Optional[Path]) -> str:
     Returns:
         Version string (e.g., "1.0", "2.0")
     """
-    if not existing_profile_path or not existing_profile_path.exists():
+    if not existing_profile_path:
         return "1.0"
 
-    # Try to read version from existing file frontmatter
+    # Try to read version from existing file frontmatter (a missing file means a new profile)
     try:
         with open(existing_profile_path, "r", encoding="utf-8") as f:
             content = f.read()
@@ -174,6 +174,8 @@ def determine_profile_version(existing_profile_path: Optional[Path]) -> str:
                             return f"{major_version + 1}.0"
                         except ValueError:
                             pass
+    except (FileNotFoundError, NotADirectoryError):
+        return "1.0"
     except Exception:
         pass
 
@@ -187,6 +189,7 @@ def assemble_presenter_profile(
     sections_data: Dict[str, Any],
     existing_profile_path: Optional[Path] = None,
     output_path: Optional[Path] = None,
+    base_dir: Optional[Path] = None,
 ) -> Dict[str, Any]:
     """Assemble final presenter profile from component JSON files.
 
@@ -196,6 +199,7 @@ def assemble_presenter_profile(
         sections_data: Generated profile sections from generation skill
         existing_profile_path: Path to existing profile (for updates)
         output_path: Optional output path for markdown file
+        base_dir: Directory containing the people/ tree (defaults to the current directory)
 
     Returns:
         Dictionary containing:
@@ -314,8 +318,9 @@ def assemble_presenter_profile(
     rendered = template.render(**context)
 
     # Determine output paths
+    people_dir = (base_dir or Path(".")) / "people"
     if output_path is None:
-        output_path = Path("people") / f"{github_username}.md"
+        output_path = people_dir / f"{github_username}.md"
 
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -325,7 +330,7 @@ def assemble_presenter_profile(
         f.write(rendered)
 
     # Create metadata JSON
-    metadata_path = Path("people") / "metadata" / f"{github_username}.json"
+    metadata_path = people_dir / "metadata" / f"{github_username}.json"
     metadata_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Get list of video IDs from aggregation data
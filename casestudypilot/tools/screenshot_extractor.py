@@ -3,9 +3,10 @@
 import json
 import re
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 import httpx
 import logging
+from rapidfuzz import fuzz
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,130 @@ IMPACT_INDICATORS = [
     r"success",
 ]
 
+# Chunk size used when streaming screenshot downloads to disk
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+_REGEX_METACHARACTERS = re.compile(r"[.*+?^${}()|\[\]\\]")
+
+
+def _compile_indicators(indicators: List[str]) -> List[Tuple[str, Optional[re.Pattern]]]:
+    """Pair each indicator with a compiled pattern, or None when it is a plain literal."""
+    return [(p, re.compile(p) if _REGEX_METACHARACTERS.search(p) else None) for p in indicators]
+
+
+# Indicators compiled once at import. Plain-literal indicators are checked with `in`, which is
+# cheaper than a regex search. All indicators are lowercase, so they are matched against
+# lowercased text; re.IGNORECASE would make every search ~3x slower.
+_VISUAL_MATCHERS = _compile_indicators(VISUAL_INDICATORS)
+_METRIC_AND_IMPACT_MATCHERS = _compile_indicators(METRIC_INDICATORS + IMPACT_INDICATORS)
+
+# Single alternations used to reject segments matching none of a group's patterns in one scan
+_ANY_VISUAL_RE = re.compile("|".join(f"(?:{p})" for p in VISUAL_INDICATORS))
+_ANY_METRIC_OR_IMPACT_RE = re.compile("|".join(f"(?:{p})" for p in METRIC_INDICATORS + IMPACT_INDICATORS))
+
+# Markdown bold spans (**text**) used as key phrases in captions
+_BOLD_RE = re.compile(r"\*\*([^*]+)\*\*")
+
+
+def _normalize_metrics(key_metrics: List) -> List[Tuple[str, str]]:
+    """Return (metric_str, lowercased metric_str) for each key metric, in order."""
+    metrics = []
+    for metric in key_metrics:
+        # Handle both dict and string formats
+        if isinstance(metric, dict):
+            metric_str = metric.get("full_statement", metric.get("value", ""))
+        else:
+            metric_str = str(metric)
+        metrics.append((metric_str, metric_str.lower()))
+    return metrics
+
+
+def _match_indicators(matchers: List[Tuple[str, Optional[re.Pattern]]], text_lower: str) -> List[str]:
+    """Return the indicators found in lowercased text, in indicator order."""
+    return [
+        indicator
+        for indicator, pattern in matchers
+        if (pattern.search(text_lower) if pattern is not None else indicator in text_lower)
+    ]
+
+
+def _score_visual(text_lower: str) -> Tuple[int, List[str]]:
+    """Score lowercased segment text against the visual indicator patterns."""
+    # Most segments match no indicator; skip them after a single scan
+    if not _ANY_VISUAL_RE.search(text_lower):
+        return 0, []
+
+    matched_phrases = _match_indicators(_VISUAL_MATCHERS, text_lower)
+    return len(matched_phrases), matched_phrases
+
+
+def _score_metrics(text_lower: str, metrics: List[Tuple[str, str]]) -> Tuple[int, Optional[str], List[str]]:
+    """Score lowercased segment text against key metrics and metric/impact indicator patterns."""
+    score = 0
+    matched_metric = None
+    matched_patterns = []
+
+    # Check for exact or fuzzy key metric matches
+    for metric_str, metric_lower in metrics:
+        # Fuzzy match with 80% threshold; score_cutoff lets rapidfuzz abandon hopeless alignments early
+        if fuzz.partial_ratio(metric_lower, text_lower, score_cutoff=80):
+            # Exact match bonus
+            score += 5 if metric_lower in text_lower else 3
+            matched_metric = metric_str
+            break
+
+    if _ANY_METRIC_OR_IMPACT_RE.search(text_lower):
+        # Check for metric indicator patterns, then impact indicator patterns
+        matched_patterns = _match_indicators(_METRIC_AND_IMPACT_MATCHERS, text_lower)
+        score += len(matched_patterns)
+
+    return score, matched_metric, matched_patterns
+
+
+def _analyze_transcript_combined(
+    transcript_segments: List[Dict[str, Any]],
+    key_metrics: List,
+    find_visual: bool = True,
+    find_metrics: bool = True,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """Find visual and/or metric moments in a single pass over the transcript."""
+    metrics = _normalize_metrics(key_metrics) if find_metrics else []
+    visual_moments = []
+    metric_moments = []
+
+    for segment in transcript_segments:
+        text = segment.get("text", "")
+        text_lower = text.lower()
+        timestamp = int(segment.get("start", 0))
+
+        if find_visual:
+            score, matched_phrases = _score_visual(text_lower)
+            if score > 0:
+                visual_moments.append(
+                    {
+                        "timestamp": timestamp,
+                        "text": text,
+                        "score": score,
+                        "matched_phrases": matched_phrases,
+                    }
+                )
+
+        if find_metrics:
+            score, matched_metric, matched_patterns = _score_metrics(text_lower, metrics)
+            # Only include if score is significant (threshold: 2)
+            if score >= 2:
+                metric_moments.append(
+                    {
+                        "timestamp": timestamp,
+                        "text": text,
+                        "score": score,
+                        "matched_metric": matched_metric,
+                        "matched_patterns": matched_patterns,
+                    }
+                )
+
+    return visual_moments, metric_moments
+
 
 def analyze_transcript_for_visual_moments(
     transcript_segments: List[Dict[str, Any]], analysis: Dict[str, Any]
@@ -64,32 +189,7 @@ def analyze_transcript_for_visual_moments(
     Returns:
         List of visual moments with timestamp, text, and score
     """
-    visual_moments = []
-
-    for segment in transcript_segments:
-        text = segment.get("text", "").lower()
-        timestamp = segment.get("start", 0)
-
-        # Score this segment based on visual indicators
-        score = 0
-        matched_phrases = []
-
-        for pattern in VISUAL_INDICATORS:
-            if re.search(pattern, text, re.IGNORECASE):
-                score += 1
-                matched_phrases.append(pattern)
-
-        if score > 0:
-            visual_moments.append(
-                {
-                    "timestamp": int(timestamp),
-                    "text": segment.get("text", ""),
-                    "score": score,
-                    "matched_phrases": matched_phrases,
-                }
-            )
-
-    return visual_moments
+    return _analyze_transcript_combined(transcript_segments, [], find_metrics=False)[0]
 
 
 def analyze_transcript_for_metric_moments(
@@ -105,69 +205,29 @@ def analyze_transcript_for_metric_moments(
     Returns:
         List of metric moments with timestamp, text, score, and matched metric
     """
-    from rapidfuzz import fuzz
-
-    metric_moments = []
+    return _analyze_transcript_combined(transcript_segments, key_metrics, find_visual=False)[1]
 
-    for segment in transcript_segments:
-        text = segment.get("text", "")
-        text_lower = text.lower()
-        timestamp = segment.get("start", 0)
 
-        score = 0
-        matched_metric = None
-        matched_patterns = []
+def analyze_transcript(
+    transcript_segments: List[Dict[str, Any]], analysis: Dict[str, Any], key_metrics: List
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Find both visual and metric moments in one pass over the transcript.
 
-        # Check for exact or fuzzy key metric matches
-        for metric in key_metrics:
-            # Handle both dict and string formats
-            if isinstance(metric, dict):
-                metric_str = metric.get("full_statement", metric.get("value", ""))
-            else:
-                metric_str = str(metric)
-            metric_lower = metric_str.lower()
-            # Fuzzy match with 80% threshold
-            if fuzz.partial_ratio(metric_lower, text_lower) >= 80:
-                # Exact match bonus
-                if metric_lower in text_lower:
-                    score += 5
-                    matched_metric = metric_str
-                else:
-                    score += 3
-                    matched_metric = metric_str
-                break
-
-        # Check for metric indicator patterns
-        for pattern in METRIC_INDICATORS:
-            if re.search(pattern, text, re.IGNORECASE):
-                score += 1
-                matched_patterns.append(pattern)
-
-        # Check for impact indicator patterns
-        for pattern in IMPACT_INDICATORS:
-            if re.search(pattern, text, re.IGNORECASE):
-                score += 1
-                matched_patterns.append(pattern)
-
-        # Only include if score is significant (threshold: 2)
-        if score >= 2:
-            metric_moments.append(
-                {
-                    "timestamp": int(timestamp),
-                    "text": text,
-                    "score": score,
-                    "matched_metric": matched_metric,
-                    "matched_patterns": matched_patterns,
-                }
-            )
+    Args:
+        transcript_segments: List of transcript segments with text, start, duration
+        analysis: Analysis data (currently unused, for future enhancements)
+        key_metrics: List of key metrics from analysis (can be strings or dicts with full_statement)
 
-    return metric_moments
+    Returns:
+        Tuple of (visual_moments, metric_moments)
+    """
+    return _analyze_transcript_combined(transcript_segments, key_metrics)
 
 
 def format_timestamp(seconds: int) -> str:
     """Convert seconds to MM:SS format."""
-    minutes = seconds // 60
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
     return f"{minutes}:{secs:02d}"
 
 
@@ -202,24 +262,27 @@ def select_optimal_timestamps(
         "impact": (video_duration * 0.70, video_duration * 1.0),
     }
 
-    # Combine all moments for processing
-    all_moments = []
-    for moment in visual_moments:
-        all_moments.append({**moment, "type": "visual"})
-    for moment in metric_moments:
-        all_moments.append({**moment, "type": "metric"})
+    section_ranges = [(section, regions.get(section, (0, video_duration))) for section in target_sections]
+
+    # Single pass over the moments keeping the highest-scoring visual and metric moment per section
+    # (strict ">" keeps the earliest moment on ties, like max())
+    best_visual: Dict[str, Dict[str, Any]] = {}
+    best_metric: Dict[str, Dict[str, Any]] = {}
+    for moments, best in ((visual_moments, best_visual), (metric_moments, best_metric)):
+        for moment in moments:
+            for section, (start_time, end_time) in section_ranges:
+                if start_time <= moment["timestamp"] < end_time:
+                    current = best.get(section)
+                    if current is None or moment["score"] > current["score"]:
+                        best[section] = moment
 
     selected = []
 
     for section in target_sections:
-        start_time, end_time = regions.get(section, (0, video_duration))
+        visual = best_visual.get(section)
+        metric = best_metric.get(section)
 
-        # Filter moments in this region
-        region_moments = [
-            m for m in all_moments if start_time <= m["timestamp"] < end_time
-        ]
-
-        if not region_moments:
+        if visual is None and metric is None:
             # Fallback to strategic timestamp
             strategic_pct = {"challenge": 0.25, "solution": 0.60, "impact": 0.85}.get(
                 section, 0.50
@@ -238,22 +301,14 @@ def select_optimal_timestamps(
 
         # Priority: Metric moments for impact section, visual moments for others
         if section == "impact":
-            # Prefer metric moments for impact section
-            metric_in_region = [m for m in region_moments if m.get("type") == "metric"]
-            if metric_in_region:
-                best_moment = max(metric_in_region, key=lambda m: m["score"])
-            else:
-                best_moment = max(region_moments, key=lambda m: m["score"])
+            is_metric = metric is not None
         else:
             # Prefer visual moments for challenge/solution, but accept metrics
-            visual_in_region = [m for m in region_moments if m.get("type") == "visual"]
-            if visual_in_region:
-                best_moment = max(visual_in_region, key=lambda m: m["score"])
-            else:
-                best_moment = max(region_moments, key=lambda m: m["score"])
+            is_metric = visual is None
+        best_moment = metric if is_metric else visual
 
         # Build reason string
-        if best_moment.get("type") == "metric":
+        if is_metric:
             matched_metric = best_moment.get("matched_metric", "")
             reason = (
                 f"Metric mentioned: '{matched_metric}'"
@@ -303,28 +358,37 @@ def generate_screenshot_url(video_id: str, quality: str = "sddefault") -> str:
     return f"https://img.youtube.com/vi/{video_id}/{quality}.jpg"
 
 
-def download_screenshot(url: str, output_path: Path) -> Dict[str, Any]:
+def download_screenshot(url: str, output_path: Path, client: Optional[httpx.Client] = None) -> Dict[str, Any]:
     """
     Download screenshot from URL to local path.
 
     Args:
         url: URL to download from
         output_path: Local path to save to
+        client: Optional shared HTTP client so repeated downloads reuse its connection pool
 
     Returns:
         Metadata about download (success, file_size, etc.)
     """
     # Ensure parent directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
+    part_path = output_path.with_name(output_path.name + ".part")
 
     try:
-        response = httpx.get(url, timeout=30.0, follow_redirects=True)
-        response.raise_for_status()
-
-        # Write to file
-        output_path.write_bytes(response.content)
-
-        file_size = len(response.content)
+        if client is not None:
+            stream = client.stream("GET", url)
+        else:
+            stream = httpx.stream("GET", url, timeout=30.0, follow_redirects=True)
+
+        # Stream the body to a sibling temp file in chunks, and only move it into place once complete
+        file_size = 0
+        with stream as response:
+            response.raise_for_status()
+            with part_path.open("wb") as f:
+                for chunk in response.iter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+                    file_size += len(chunk)
+        part_path.replace(output_path)
 
         return {
             "success": True,
@@ -334,6 +398,8 @@ def download_screenshot(url: str, output_path: Path) -> Dict[str, Any]:
         }
 
     except Exception as e:
+        # Never leave a truncated download behind; any existing file at output_path is untouched
+        part_path.unlink(missing_ok=True)
         return {"success": False, "error": str(e), "path": str(output_path), "url": url}
 
 
@@ -373,7 +439,7 @@ def generate_caption(
     first_part = section_text[:300]
 
     # Look for bold items (likely key concepts)
-    bold_matches = re.findall(r"\*\*([^*]+)\*\*", first_part)
+    bold_matches = _BOLD_RE.findall(first_part)
 
     if section == "challenge":
         if bold_matches:
@@ -398,7 +464,11 @@ def generate_caption(
 
 
 def extract_frame_with_fallback(
-    video_url: str, video_id: str, timestamp: int, output_path: Path
+    video_url: str,
+    video_id: str,
+    timestamp: int,
+    output_path: Path,
+    client: Optional[httpx.Client] = None,
 ) -> Dict[str, Any]:
     """
     Attempt frame extraction, fallback to thumbnail API if it fails.
@@ -408,6 +478,7 @@ def extract_frame_with_fallback(
         video_id: YouTube video ID
         timestamp: Timestamp in seconds
         output_path: Where to save the image
+        client: Optional shared HTTP client for the thumbnail fallback
 
     Returns:
         Dict with success status, method used, and file info
@@ -440,7 +511,7 @@ def extract_frame_with_fallback(
 
     # Fallback to thumbnail API
     thumbnail_url = generate_screenshot_url(video_id)
-    download_result = download_screenshot(thumbnail_url, output_path)
+    download_result = download_screenshot(thumbnail_url, output_path, client=client)
 
     if download_result["success"]:
         download_result["method"] = "thumbnail_fallback"
@@ -506,14 +577,8 @@ def extract_screenshots(
     logger.info(f"Found {len(key_metrics)} key metrics in analysis")
 
     # Analyze transcript for visual AND metric moments
-    visual_moments = analyze_transcript_for_visual_moments(
-        transcript_segments, analysis
-    )
+    visual_moments, metric_moments = analyze_transcript(transcript_segments, analysis, key_metrics)
     logger.info(f"Found {len(visual_moments)} visual moments")
-
-    metric_moments = analyze_transcript_for_metric_moments(
-        transcript_segments, key_metrics
-    )
     logger.info(f"Found {len(metric_moments)} metric moments")
 
     # Select optimal timestamps for 3 screenshots (challenge, solution, impact)
@@ -533,56 +598,58 @@ def extract_screenshots(
     # Create directory
     download_dir.mkdir(parents=True, exist_ok=True)
 
-    # Process each selected moment
+    # Process each selected moment, sharing one HTTP client so thumbnail downloads reuse connections
     screenshots = []
 
-    for moment in selected_moments:
-        section = moment["section"]
-        logger.info(f"Processing {section} screenshot at {moment['timestamp']}s")
+    with httpx.Client(timeout=30.0, follow_redirects=True) as client:
+        for moment in selected_moments:
+            section = moment["section"]
+            logger.info(f"Processing {section} screenshot at {moment['timestamp']}s")
+
+            # Determine local filename
+            local_filename = f"{section}.jpg"
+            local_path = download_dir / local_filename
+
+            # Extract frame with fallback to thumbnail
+            extraction_result = extract_frame_with_fallback(
+                video_url=video_url,
+                video_id=video_id,
+                timestamp=moment["timestamp"],
+                output_path=local_path,
+                client=client,
+            )
 
-        # Determine local filename
-        local_filename = f"{section}.jpg"
-        local_path = download_dir / local_filename
+            # Generate caption
+            caption = generate_caption(section, sections, moment)
 
-        # Extract frame with fallback to thumbnail
-        extraction_result = extract_frame_with_fallback(
-            video_url=video_url,
-            video_id=video_id,
-            timestamp=moment["timestamp"],
-            output_path=local_path,
-        )
-
-        # Generate caption
-        caption = generate_caption(section, sections, moment)
-
-        # Build screenshot metadata
-        screenshot_data = {
-            "section": section,
-            "timestamp": moment["timestamp"],
-            "timestamp_formatted": moment["timestamp_formatted"],
-            "reason": moment["reason"],
-            "local_path": str(local_path),
-            "caption": caption,
-            "extraction_method": extraction_result.get("method", "unknown"),
-            "download_success": extraction_result["success"],
-        }
+            # Build screenshot metadata
+            screenshot_data = {
+                "section": section,
+                "timestamp": moment["timestamp"],
+                "timestamp_formatted": moment["timestamp_formatted"],
+                "reason": moment["reason"],
+                "local_path": str(local_path),
+                "caption": caption,
+                "extraction_method": extraction_result.get("method", "unknown"),
+                "download_success": extraction_result["success"],
+            }
 
-        # Add matched metric if available
-        if moment.get("matched_metric"):
-            screenshot_data["matched_metric"] = moment["matched_metric"]
+            # Add matched metric if available
+            if moment.get("matched_metric"):
+                screenshot_data["matched_metric"] = moment["matched_metric"]
 
-        if not extraction_result["success"]:
-            screenshot_data["download_error"] = extraction_result.get(
-                "error", "Unknown error"
-            )
-        else:
-            screenshot_data["file_size"] = extraction_result.get("file_size", 0)
+            if not extraction_result["success"]:
+                screenshot_data["download_error"] = extraction_result.get(
+                    "error", "Unknown error"
+                )
+            else:
+                screenshot_data["file_size"] = extraction_result.get("file_size", 0)
 
-        # Add fallback reason if applicable
-        if "fallback_reason" in extraction_result:
-            screenshot_data["fallback_reason"] = extraction_result["fallback_reason"]
+            # Add fallback reason if applicable
+            if "fallback_reason" in extraction_result:
+                screenshot_data["fallback_reason"] = extraction_result["fallback_reason"]
 
-        screenshots.append(screenshot_data)
+            screenshots.append(screenshot_data)
 
     # Prepare output
     result = {"company_slug": company_slug, "screenshots": screenshots}
@@ -3,15 +3,15 @@
 import json
 import sys
 from pathlib import Path
-from typing import Dict, Any, List, Tuple
+from typing import Dict, Any, List, Tuple, Union
 
 
-def validate_deep_analysis(analysis_file: Path) -> Tuple[int, str]:
+def validate_deep_analysis(analysis: Union[Path, Dict[str, Any]]) -> Tuple[int, str]:
     """
     Validate deep analysis JSON output.
 
     Args:
-        analysis_file: Path to deep analysis JSON file
+        analysis: Path to deep analysis JSON file, or the already-parsed analysis dict
 
     Returns:
         Tuple of (exit_code, message)
@@ -19,15 +19,38 @@ def validate_deep_analysis(analysis_file: Path) -> Tuple[int, str]:
         - 1: Warning
         - 2: Critical failure
     """
-    # Load and parse JSON
+    if isinstance(analysis, dict):
+        return _validate_parsed(analysis)
+
     try:
-        with open(analysis_file) as f:
-            data = json.load(f)
-    except json.JSONDecodeError as e:
-        return 2, f"Invalid JSON: {e}"
+        raw = Path(analysis).read_bytes()
     except Exception as e:
         return 2, f"Cannot read file: {e}"
 
+    return validate_deep_analysis_bytes(raw)
+
+
+def validate_deep_analysis_bytes(raw: bytes) -> Tuple[int, str]:
+    """
+    Validate deep analysis JSON supplied as raw bytes, without touching disk.
+
+    Args:
+        raw: Encoded deep analysis JSON document
+
+    Returns:
+        Tuple of (exit_code, message), with the same codes as validate_deep_analysis
+    """
+    try:
+        data = json.loads(raw)
+    except ValueError as e:
+        # JSONDecodeError, or UnicodeDecodeError for bytes that are not valid UTF-8/16/32
+        return 2, f"Invalid JSON: {e}"
+
+    return _validate_parsed(data)
+
+
+def _validate_parsed(data: Dict[str, Any]) -> Tuple[int, str]:
+    """Run the deep analysis checks against parsed data, returning (exit_code, message)."""
     exit_code = 0
     warnings = []
 
@@ -13,6 +13,73 @@ from rapidfuzz import fuzz
 
 logger = logging.getLogger(__name__)
 
+# Lowercased placeholder values rejected as company or presenter names
+GENERIC_COMPANY_NAMES = frozenset({"company", "organization", "tech", "unknown", "tbd", "n/a", "none"})
+GENERIC_PRESENTER_NAMES = frozenset({"presenter", "speaker", "person", "user", "unknown", "tbd", "n/a"})
+
+# Placeholder full names (matched against the lowercased name), compiled once into a single alternation
+PLACEHOLDER_NAME_RE = re.compile(
+    r"^(first|last|full)\s*name$"
+    r"|^name\s*(here|tbd)?$"
+    r"|^(presenter|speaker|user)$"
+    r"|lorem ipsum"
+    r"|todo|tbd|n/a"
+)
+
+# Placeholder phrases rejected in biographies and generated profile content (lowercase substrings)
+PROFILE_PLACEHOLDER_PHRASES = ("lorem ipsum", "placeholder", "todo", "tbd", "fill in")
+BIO_PLACEHOLDER_PHRASES = PROFILE_PLACEHOLDER_PHRASES + ("add bio here",)
+
+# Patterns for metric claims in generated content: percentages, numbers with units, time expressions
+METRIC_CLAIM_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\d+%",  # 50%
+        r"\d+x",  # 3x
+        r"\d+[,\d]*\s+(?:pods?|services?|nodes?|clusters?|users?|requests?|microservices?)",  # 10,000 pods
+        r"\d+\s+(?:hours?|minutes?|seconds?|days?|weeks?|months?)",  # 2 hours
+        r"\$\d+[,\d]*",  # $100,000
+    )
+)
+
+# Common company names to check against in company consistency checks (expand as needed)
+KNOWN_COMPANIES = (
+    "Spotify",
+    "Netflix",
+    "Uber",
+    "Airbnb",
+    "Adobe",
+    "Apple",
+    "Google",
+    "Microsoft",
+    "Amazon",
+    "Facebook",
+    "Meta",
+    "Twitter",
+    "LinkedIn",
+    "Slack",
+    "Dropbox",
+    "GitHub",
+    "GitLab",
+    "Atlassian",
+    "Salesforce",
+    "Oracle",
+    "IBM",
+    "Red Hat",
+    "Intel",
+    "Nvidia",
+    "Tesla",
+    "Intuit",
+    "PayPal",
+    "eBay",
+    "Etsy",
+    "Lyft",
+    "DoorDash",
+    "Stripe",
+    "Square",
+    "Shopify",
+)
+
 
 class Severity(Enum):
     """Validation severity levels."""
@@ -189,8 +256,7 @@ def validate_company_name(company_name: str, video_title: str, confidence: float
     )
 
     # Check 2: Not a generic placeholder
-    generic_names = ["company", "organization", "tech", "unknown", "tbd", "n/a", "none"]
-    is_generic = company_name.lower().strip() in generic_names if company_name else True
+    is_generic = company_name.lower().strip() in GENERIC_COMPANY_NAMES if company_name else True
     checks.append(
         ValidationCheck(
             name="not_generic",
@@ -353,29 +419,22 @@ def validate_metrics(
     # Extract all numbers/metrics from generated content
     all_generated_text = " ".join(str(v) for v in generated_sections.values())
 
-    # Patterns for metrics: percentages, numbers with units, time expressions
-    metric_patterns = [
-        r"\d+%",  # 50%
-        r"\d+x",  # 3x
-        r"\d+[,\d]*\s+(?:pods?|services?|nodes?|clusters?|users?|requests?|microservices?)",  # 10,000 pods
-        r"\d+\s+(?:hours?|minutes?|seconds?|days?|weeks?|months?)",  # 2 hours
-        r"\$\d+[,\d]*",  # $100,000
-    ]
-
     found_metrics = []
-    for pattern in metric_patterns:
-        found_metrics.extend(re.findall(pattern, all_generated_text, re.IGNORECASE))
+    for pattern in METRIC_CLAIM_PATTERNS:
+        found_metrics.extend(pattern.findall(all_generated_text))
 
     # Check each metric against original transcript
     fabricated_metrics = []
+    transcript_chunks = None
     for metric in found_metrics:
         # Use fuzzy matching to allow for rephrasing
         # e.g., "50%" might appear as "50 percent" in transcript
         if metric not in original_transcript:
             # Try fuzzy match
             metric_normalized = metric.replace(",", "").replace("$", "")
-            # Split transcript into chunks for fuzzy matching
-            transcript_chunks = original_transcript.split()
+            # Split transcript into chunks for fuzzy matching (once, on first use)
+            if transcript_chunks is None:
+                transcript_chunks = original_transcript.split()
             if not any(fuzz.partial_ratio(metric_normalized, chunk) > 85 for chunk in transcript_chunks):
                 fabricated_metrics.append(metric)
 
@@ -573,44 +632,6 @@ def validate_company_consistency(
 
     all_generated_text = " ".join(str(v) for v in generated_sections.values())
 
-    # Common company names to check against (expand as needed)
-    known_companies = [
-        "Spotify",
-        "Netflix",
-        "Uber",
-        "Airbnb",
-        "Adobe",
-        "Apple",
-        "Google",
-        "Microsoft",
-        "Amazon",
-        "Facebook",
-        "Meta",
-        "Twitter",
-        "LinkedIn",
-        "Slack",
-        "Dropbox",
-        "GitHub",
-        "GitLab",
-        "Atlassian",
-        "Salesforce",
-        "Oracle",
-        "IBM",
-        "Red Hat",
-        "Intel",
-        "Nvidia",
-        "Tesla",
-        "Intuit",
-        "PayPal",
-        "eBay",
-        "Etsy",
-        "Lyft",
-        "DoorDash",
-        "Stripe",
-        "Square",
-        "Shopify",
-    ]
-
     # Check if expected company is mentioned
     expected_mentioned = expected_company.lower() in all_generated_text.lower()
     checks.append(
@@ -627,7 +648,7 @@ def validate_company_consistency(
     # Check for mentions of other major companies
     # Use word boundary matching to avoid false positives like "uber" in "kubernetes"
     other_companies_mentioned = []
-    for company in known_companies:
+    for company in KNOWN_COMPANIES:
         if company.lower() == expected_company.lower():
             continue
         # Use word boundary regex to match whole words only
@@ -683,6 +704,14 @@ def validate_company_consistency(
 # =============================================================================
 
 
+def _video_search_text(video: Dict[str, Any]) -> str:
+    """Lowercase a video's title, description and transcript into one searchable string.
+
+    Fields are joined with newlines so a name cannot match across field boundaries.
+    """
+    return "\n".join((video.get("title", ""), video.get("description", ""), video.get("transcript", ""))).lower()
+
+
 def validate_presenter(presenter_name: str, videos_data: Dict[str, Any]) -> ValidationResult:
     """Validate presenter name appears consistently across videos.
 
@@ -708,8 +737,7 @@ def validate_presenter(presenter_name: str, videos_data: Dict[str, Any]) -> Vali
     )
 
     # Check 2: Not generic
-    generic_names = ["presenter", "speaker", "person", "user", "unknown", "tbd", "n/a"]
-    is_generic = presenter_name.lower().strip() in generic_names if presenter_name else True
+    is_generic = presenter_name.lower().strip() in GENERIC_PRESENTER_NAMES if presenter_name else True
     checks.append(
         ValidationCheck(
             name="not_generic",
@@ -741,15 +769,11 @@ def validate_presenter(presenter_name: str, videos_data: Dict[str, Any]) -> Vali
     matches = 0
 
     for video in successful_videos:
-        title = video.get("title", "").lower()
-        description = video.get("description", "").lower()
-        transcript = video.get("transcript", "").lower()
+        video_text = _video_search_text(video)
 
         # Check if full name or name parts appear
-        full_name_match = name_lower in title or name_lower in description or name_lower in transcript
-        partial_match = any(
-            part in title or part in description or part in transcript for part in name_parts if len(part) > 2
-        )
+        full_name_match = name_lower in video_text
+        partial_match = any(part in video_text for part in name_parts if len(part) > 2)
 
         if full_name_match or partial_match:
             matches += 1
@@ -835,14 +859,7 @@ def validate_biography(biography_data: Dict[str, Any]) -> ValidationResult:
 
     # Check 2: Full name not generic/placeholder
     full_name = biography_data.get("full_name", "")
-    placeholder_patterns = [
-        r"^(first|last|full)\s*name$",
-        r"^name\s*(here|tbd)?$",
-        r"^(presenter|speaker|user)$",
-        r"lorem ipsum",
-        r"todo|tbd|n/a",
-    ]
-    is_placeholder = any(re.search(pattern, full_name.lower()) for pattern in placeholder_patterns)
+    is_placeholder = PLACEHOLDER_NAME_RE.search(full_name.lower()) is not None
     checks.append(
         ValidationCheck(
             name="no_placeholder_name",
@@ -867,15 +884,7 @@ def validate_biography(biography_data: Dict[str, Any]) -> ValidationResult:
 
     # Check 4: Biography not placeholder text
     bio_lower = biography.lower()
-    bio_placeholder_patterns = [
-        "lorem ipsum",
-        "placeholder",
-        "todo",
-        "tbd",
-        "fill in",
-        "add bio here",
-    ]
-    has_placeholder = any(pattern in bio_lower for pattern in bio_placeholder_patterns)
+    has_placeholder = any(phrase in bio_lower for phrase in BIO_PLACEHOLDER_PHRASES)
     checks.append(
         ValidationCheck(
             name="no_placeholder_bio",
@@ -955,11 +964,7 @@ def validate_profile_update(
     name_matches = 0
 
     for video in new_videos:
-        title = video.get("title", "").lower()
-        description = video.get("description", "").lower()
-        transcript = video.get("transcript", "").lower()
-
-        if name_lower in title or name_lower in description or name_lower in transcript:
+        if name_lower in _video_search_text(video):
             name_matches += 1
 
     match_rate = name_matches / len(new_videos) if new_videos else 0
@@ -1107,8 +1112,7 @@ def validate_presenter_profile(profile_data: Dict[str, Any], threshold: float =
     ]
     combined_content = " ".join(content_parts).lower()
 
-    placeholder_patterns = ["lorem ipsum", "placeholder", "todo", "tbd", "fill in"]
-    has_placeholders = any(p in combined_content for p in placeholder_patterns)
+    has_placeholders = any(p in combined_content for p in PROFILE_PLACEHOLDER_PHRASES)
 
     consistency_score = 0.0 if has_placeholders else 1.0
 
@@ -1122,10 +1126,15 @@ def validate_presenter_profile(profile_data: Dict[str, Any], threshold: float =
         )
     )
 
-    # Calculate overall quality score
-    weights = [0.2, 0.2, 0.2, 0.2, 0.2]
-    scores = [structure_score, bio_score, talk_score, expertise_score, consistency_score]
-    overall_score = sum(w * s for w, s in zip(weights, scores))
+    # Calculate overall quality score (equal 0.2 weights, i.e. the mean of all factors)
+    factors = {
+        "structure": structure_score,
+        "biography": bio_score,
+        "talks": talk_score,
+        "expertise": expertise_score,
+        "consistency": consistency_score,
+    }
+    overall_score = sum(factors.values()) / len(factors)
 
     checks.append(
         ValidationCheck(
@@ -1144,13 +1153,7 @@ def validate_presenter_profile(profile_data: Dict[str, Any], threshold: float =
             details={
                 "score": overall_score,
                 "threshold": threshold,
-                "factors": {
-                    "structure": structure_score,
-                    "biography": bio_score,
-                    "talks": talk_score,
-                    "expertise": expertise_score,
-                    "consistency": consistency_score,
-                },
+                "factors": factors,
             },
         )
     )
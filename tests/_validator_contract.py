@@ -0,0 +1,16 @@
+"""Assertions shared by the validator CLI test modules."""
+
+from typing import Callable, Tuple
+
+
+def assert_file_not_found(main_fn: Callable[[str], int]) -> None:
+    """Assert that a validator CLI entry point returns exit code 2 for a missing file."""
+    assert main_fn("/nonexistent/file.json") == 2
+
+
+def assert_validation_result(result: Tuple[int, str], expected_code: int, *expected_substrings: str) -> None:
+    """Assert a validator's (exit_code, message) result has the expected code and message substrings."""
+    exit_code, message = result
+    assert exit_code == expected_code, message
+    for substring in expected_substrings:
+        assert substring in message
@@ -2,7 +2,6 @@
 
 import pytest
 import json
-import tempfile
 from pathlib import Path
 from casestudypilot.tools.assemble_reference_architecture import assemble_reference_architecture, copy_screenshots, main
 
@@ -9,6 +9,20 @@ from casestudypilot.validation import (
     Severity,
 )
 
+# Complete, minimal profile shared by the profile-quality tests; tests override single fields.
+# It passes at the default 0.6 threshold (score 0.698), so each override alone decides the outcome.
+BASE_PROFILE = {
+    "overview": "Overview",
+    "expertise": "Expertise",
+    "talk_highlights": "Highlights",
+    "key_themes": "Themes",
+    "stats_table": "Stats",
+    "biography": "Adequate biography with enough content to pass minimum requirements. " * 5,  # 345 chars
+    "talk_summaries": [{"title": "Talk 1"}, {"title": "Talk 2"}],
+    "expertise_areas": [{"area": "Kubernetes"}],
+    "cncf_projects": [{"name": "Kubernetes"}],
+}
+
 
 class TestValidatePresenter:
     """Tests for validate_presenter function."""
@@ -618,57 +632,28 @@ class TestValidatePresenterProfile:
         failed = result.get_failed_checks()
         assert any(c.name == "factual_consistency" and "placeholder" in c.message.lower() for c in failed)
 
-    def test_no_cncf_projects_critical(self):
-        """Test critical failure when no CNCF projects identified."""
-        profile_data = {
-            "overview": "Overview",
-            "expertise": "Expertise",
-            "talk_highlights": "Highlights",
-            "key_themes": "Themes",
-            "stats_table": "Stats",
-            "biography": "A biography with sufficient length to pass the minimum character count requirement for quality.",
-            "talk_summaries": [
-                {"title": "Talk 1"},
-                {"title": "Talk 2"},
-            ],
-            "expertise_areas": [{"area": "General"}],
-            "cncf_projects": [],  # No CNCF projects
-        }
-
-        result = validate_presenter_profile(profile_data)
-
-        assert result.status == Severity.CRITICAL
-        failed = result.get_failed_checks()
-        assert any(c.name == "expertise_identification" and "No CNCF projects" in c.message for c in failed)
-
-    def test_too_few_talks_critical(self):
-        """Test critical failure when less than 2 talks."""
-        profile_data = {
-            "overview": "Overview",
-            "expertise": "Expertise",
-            "talk_highlights": "Highlights",
-            "key_themes": "Themes",
-            "stats_table": "Stats",
-            "biography": "A biography with sufficient length to meet the minimum requirements for profile quality.",
-            "talk_summaries": [{"title": "Only one talk"}],  # < 2
-            "expertise_areas": [{"area": "Kubernetes"}],
-            "cncf_projects": [{"name": "Kubernetes"}],
-        }
+    @pytest.mark.parametrize(
+        "overrides,failed_check,message_fragment",
+        [
+            ({"cncf_projects": []}, "expertise_identification", "No CNCF projects"),
+            ({"talk_summaries": [{"title": "Only one talk"}]}, "talk_coverage", "Too few talks"),
+        ],
+        ids=["no_cncf_projects", "too_few_talks"],
+    )
+    def test_single_factor_critical(self, overrides, failed_check, message_fragment):
+        """Test critical failure when one factor of an otherwise complete profile is missing."""
+        profile_data = {**BASE_PROFILE, **overrides}
 
         result = validate_presenter_profile(profile_data)
 
         assert result.status == Severity.CRITICAL
         failed = result.get_failed_checks()
-        assert any(c.name == "talk_coverage" and "Too few talks" in c.message for c in failed)
+        assert any(c.name == failed_check and message_fragment in c.message for c in failed)
 
     def test_quality_score_calculation(self):
         """Test that quality score is calculated correctly."""
         profile_data = {
-            "overview": "Overview",
-            "expertise": "Expertise",
-            "talk_highlights": "Highlights",
-            "key_themes": "Themes",
-            "stats_table": "Stats",
+            **BASE_PROFILE,
             "biography": "A" * 500,  # 500 chars = full bio score
             "talk_summaries": [{"title": f"Talk {i}"} for i in range(5)],  # 5 talks = full score
             "expertise_areas": [{"area": f"Area {i}"} for i in range(3)],
@@ -684,20 +669,11 @@ class TestValidatePresenterProfile:
 
     def test_custom_threshold(self):
         """Test profile validation with custom threshold."""
-        profile_data = {
-            "overview": "Overview",
-            "expertise": "Expertise",
-            "talk_highlights": "Highlights",
-            "key_themes": "Themes",
-            "stats_table": "Stats",
-            "biography": "Adequate biography with enough content to pass minimum requirements.",
-            "talk_summaries": [{"title": "Talk 1"}, {"title": "Talk 2"}],
-            "expertise_areas": [{"area": "Kubernetes"}],
-            "cncf_projects": [{"name": "Kubernetes"}],
-        }
+        # The base profile passes at the default threshold
+        assert validate_presenter_profile(dict(BASE_PROFILE)).status == Severity.PASS
 
         # Test with higher threshold (0.80)
-        result = validate_presenter_profile(profile_data, threshold=0.80)
+        result = validate_presenter_profile(dict(BASE_PROFILE), threshold=0.80)
 
         # Should fail with higher threshold
         assert result.status == Severity.CRITICAL
@@ -1,11 +1,12 @@
 """Tests for profile assembler functionality."""
 
 import json
+import re
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
 from datetime import datetime
 
+from casestudypilot.tools import profile_assembler
 from casestudypilot.tools.profile_assembler import (
     load_json_file,
     calculate_stats,
@@ -14,22 +15,74 @@ from casestudypilot.tools.profile_assembler import (
 )
 
 
+class StubTemplate:
+    """Minimal stand-in for a Jinja2 template that records each render context."""
+
+    def __init__(self, rendered="Profile"):
+        self.rendered = rendered
+        self.calls = []
+
+    def render(self, **context):
+        self.calls.append(context)
+        return self.rendered
+
+
+class StubEnv:
+    """Minimal stand-in for a Jinja2 Environment serving a single template."""
+
+    def __init__(self, template, error=None):
+        self.template = template
+        self.error = error
+
+    def get_template(self, name):
+        if self.error is not None:
+            raise self.error
+        return self.template
+
+
+# Expected error messages, compiled once for pytest.raises(match=...)
+FILE_NOT_FOUND_RE = re.compile("File not found")
+MISSING_NAME_RE = re.compile("missing required 'name' field")
+MISSING_GITHUB_USERNAME_RE = re.compile("missing required 'github_username' field")
+TEMPLATE_NOT_FOUND_RE = re.compile("Template not found")
+
+SAMPLE_DATA = {"name": "Jane Doe", "bio": "Software Engineer"}
+SAMPLE_JSON = json.dumps(SAMPLE_DATA)
+
+# (total_speaking_minutes, expected total_speaking_time)
+DURATION_CASES = [
+    (60, "1 hours"),  # Exactly 1 hour
+    (90, "1 hours 30 minutes"),  # 1.5 hours
+    (120, "2 hours"),  # Exactly 2 hours
+    (125, "2 hours 5 minutes"),  # 2 hours 5 minutes
+    (30, "30 minutes"),  # Less than 1 hour
+]
+
+# (organizations, expected organizations string)
+ORG_CASES = [
+    (["cncf"], "CNCF"),  # Uppercase short names
+    (["kubernetes-sigs"], "Kubernetes SIGs"),  # Special case
+    (["github"], "Github"),  # Title case
+    (["cncf", "kubernetes", "prometheus"], "CNCF, Kubernetes, Prometheus"),  # Multiple
+    (["org1", "org2", "org3", "org4"], "Org1, Org2, Org3"),  # Limit to 3
+]
+
+
 class TestLoadJsonFile:
     """Tests for load_json_file function."""
 
     def test_load_valid_json(self, tmp_path):
         """Test loading valid JSON file."""
-        data = {"name": "Jane Doe", "bio": "Software Engineer"}
         json_file = tmp_path / "test.json"
-        json_file.write_text(json.dumps(data))
+        json_file.write_text(SAMPLE_JSON)
 
         result = load_json_file(json_file)
 
-        assert result == data
+        assert result == SAMPLE_DATA
 
     def test_load_json_file_not_found(self):
         """Test FileNotFoundError when file doesn't exist."""
-        with pytest.raises(FileNotFoundError, match="File not found"):
+        with pytest.raises(FileNotFoundError, match=FILE_NOT_FOUND_RE):
             load_json_file(Path("/nonexistent/file.json"))
 
     def test_load_invalid_json(self, tmp_path):
@@ -44,6 +97,18 @@ class TestLoadJsonFile:
 class TestCalculateStats:
     """Tests for calculate_stats function."""
 
+    @pytest.fixture
+    def base_aggregation(self):
+        """Fixture providing single-talk aggregation data; tests derive variants from it."""
+        return {
+            "stats": {
+                "total_talks": 1,
+                "years_active": {"first": 2024, "latest": 2024, "span": 0},
+                "most_discussed_project": {"name": "Kubernetes", "count": 1},
+                "total_speaking_minutes": 50,
+            }
+        }
+
     def test_calculate_stats_complete_data(self):
         """Test stats calculation with complete data."""
         aggregation_data = {
@@ -61,24 +126,28 @@ class TestCalculateStats:
             }
         }
 
+        expected = {
+            "total_talks": "5 presentations",
+            "years_active": "2020 - 2024 (4 years)",
+            "top_technology": "Kubernetes (3 talks)",
+            "github_followers": "250",
+            "organizations": "CNCF, Kubernetes, Kubernetes SIGs",
+            "total_speaking_time": "2 hours 30 minutes",
+        }
+
         stats = calculate_stats(aggregation_data, biography_data)
 
-        assert stats["total_talks"] == "5 presentations"
-        assert stats["years_active"] == "2020 - 2024 (4 years)"
-        assert stats["top_technology"] == "Kubernetes (3 talks)"
-        assert stats["github_followers"] == "250"
-        assert stats["organizations"] == "CNCF, Kubernetes, Kubernetes SIGs"
-        assert stats["total_speaking_time"] == "2 hours 30 minutes"
+        assert {k: stats[k] for k in expected} == expected
 
-    def test_calculate_stats_single_talk(self):
+    def test_calculate_stats_single_talk(self, base_aggregation):
         """Test stats with single talk (singular form)."""
         aggregation_data = {
+            **base_aggregation,
             "stats": {
-                "total_talks": 1,
-                "years_active": {"first": 2024, "latest": 2024, "span": 0},
+                **base_aggregation["stats"],
                 "most_discussed_project": {"name": "Envoy", "count": 1},
                 "total_speaking_minutes": 45,
-            }
+            },
         }
         biography_data = {"github_data": {"followers": 50, "organizations": []}}
 
@@ -89,39 +158,22 @@ class TestCalculateStats:
         assert stats["top_technology"] == "Envoy (1 talk)"  # Singular
         assert stats["total_speaking_time"] == "45 minutes"
 
-    def test_calculate_stats_duration_formatting(self):
+    @pytest.mark.parametrize("total_minutes,expected", DURATION_CASES)
+    def test_calculate_stats_duration_formatting(self, base_aggregation, total_minutes, expected):
         """Test duration formatting edge cases."""
-        test_cases = [
-            (60, "1 hours"),  # Exactly 1 hour
-            (90, "1 hours 30 minutes"),  # 1.5 hours
-            (120, "2 hours"),  # Exactly 2 hours
-            (125, "2 hours 5 minutes"),  # 2 hours 5 minutes
-            (30, "30 minutes"),  # Less than 1 hour
-        ]
-
-        for total_minutes, expected in test_cases:
-            aggregation_data = {
-                "stats": {
-                    "total_talks": 1,
-                    "years_active": {"first": 2024, "latest": 2024, "span": 0},
-                    "most_discussed_project": {"name": "Kubernetes", "count": 1},
-                    "total_speaking_minutes": total_minutes,
-                }
-            }
-            biography_data = {"github_data": {"followers": 0, "organizations": []}}
+        aggregation_data = {
+            **base_aggregation,
+            "stats": {**base_aggregation["stats"], "total_speaking_minutes": total_minutes},
+        }
+        biography_data = {"github_data": {"followers": 0, "organizations": []}}
 
-            stats = calculate_stats(aggregation_data, biography_data)
-            assert stats["total_speaking_time"] == expected
+        stats = calculate_stats(aggregation_data, biography_data)
+        assert stats["total_speaking_time"] == expected
 
-    def test_calculate_stats_primary_focus_multiple_areas(self):
+    def test_calculate_stats_primary_focus_multiple_areas(self, base_aggregation):
         """Test primary focus with multiple expertise areas."""
         aggregation_data = {
-            "stats": {
-                "total_talks": 3,
-                "years_active": {"first": 2022, "latest": 2024, "span": 2},
-                "most_discussed_project": {"name": "Kubernetes", "count": 2},
-                "total_speaking_minutes": 100,
-            },
+            **base_aggregation,
             "expertise_areas": [
                 {"area": "Container Orchestration", "talk_count": 3},
                 {"area": "GitOps", "talk_count": 2},
@@ -135,46 +187,22 @@ class TestCalculateStats:
         # Should show top 2 areas
         assert stats["primary_focus"] == "Container Orchestration & GitOps"
 
-    def test_calculate_stats_no_expertise_areas(self):
+    def test_calculate_stats_no_expertise_areas(self, base_aggregation):
         """Test primary focus when no expertise areas."""
-        aggregation_data = {
-            "stats": {
-                "total_talks": 1,
-                "years_active": {"first": 2024, "latest": 2024, "span": 0},
-                "most_discussed_project": {"name": "Kubernetes", "count": 1},
-                "total_speaking_minutes": 50,
-            },
-            "expertise_areas": [],
-        }
+        aggregation_data = {**base_aggregation, "expertise_areas": []}
         biography_data = {"github_data": {"followers": 0, "organizations": []}}
 
         stats = calculate_stats(aggregation_data, biography_data)
 
         assert stats["primary_focus"] == "N/A"
 
-    def test_calculate_stats_organization_formatting(self):
+    @pytest.mark.parametrize("orgs,expected", ORG_CASES)
+    def test_calculate_stats_organization_formatting(self, base_aggregation, orgs, expected):
         """Test organization name formatting."""
-        test_cases = [
-            (["cncf"], "CNCF"),  # Uppercase short names
-            (["kubernetes-sigs"], "Kubernetes SIGs"),  # Special case
-            (["github"], "Github"),  # Title case
-            (["cncf", "kubernetes", "prometheus"], "CNCF, Kubernetes, Prometheus"),  # Multiple
-            (["org1", "org2", "org3", "org4"], "Org1, Org2, Org3"),  # Limit to 3
-        ]
-
-        for orgs, expected in test_cases:
-            aggregation_data = {
-                "stats": {
-                    "total_talks": 1,
-                    "years_active": {"first": 2024, "latest": 2024, "span": 0},
-                    "most_discussed_project": {"name": "K8s", "count": 1},
-                    "total_speaking_minutes": 50,
-                }
-            }
-            biography_data = {"github_data": {"followers": 0, "organizations": orgs}}
+        biography_data = {"github_data": {"followers": 0, "organizations": orgs}}
 
-            stats = calculate_stats(aggregation_data, biography_data)
-            assert stats["organizations"] == expected
+        stats = calculate_stats(base_aggregation, biography_data)
+        assert stats["organizations"] == expected
 
     def test_calculate_stats_missing_data(self):
         """Test stats calculation with missing data."""
@@ -205,59 +233,43 @@ class TestDetermineProfileVersion:
         result = determine_profile_version(nonexistent)
         assert result == "1.0"
 
-    def test_increment_version_from_existing(self, tmp_path):
-        """Test version increments from existing profile."""
-        existing_profile = tmp_path / "profile.md"
-        existing_profile.write_text("""---
-name: Jane Doe
-profile_version: 1.0
----
-
-# Jane Doe
-""")
-
-        result = determine_profile_version(existing_profile)
-        assert result == "2.0"
-
-    def test_increment_version_from_2_0(self, tmp_path):
-        """Test version increments from 2.0 to 3.0."""
-        existing_profile = tmp_path / "profile.md"
-        existing_profile.write_text("""---
-profile_version: 2.0
----
-
-# Profile Content
-""")
-
-        result = determine_profile_version(existing_profile)
-        assert result == "3.0"
-
-    def test_version_without_frontmatter(self, tmp_path):
-        """Test default increment when no version in frontmatter."""
-        existing_profile = tmp_path / "profile.md"
-        existing_profile.write_text("# Jane Doe\n\nNo frontmatter here")
-
-        result = determine_profile_version(existing_profile)
-        assert result == "2.0"  # Default increment
+    def test_new_profile_path_under_regular_file(self, tmp_path):
+        """Test version 1.0 when a parent of the path is a regular file."""
+        not_a_dir = tmp_path / "people"
+        not_a_dir.write_text("")
+        result = determine_profile_version(not_a_dir / "janedoe.md")
+        assert result == "1.0"
 
-    def test_version_with_invalid_format(self, tmp_path):
-        """Test default increment when version format is invalid."""
+    @pytest.mark.parametrize(
+        "content,expected",
+        [
+            ("---\nname: Jane Doe\nprofile_version: 1.0\n---\n\n# Jane Doe\n", "2.0"),
+            ("---\nprofile_version: 2.0\n---\n\n# Profile Content\n", "3.0"),
+            ("# Jane Doe\n\nNo frontmatter here", "2.0"),  # Default increment
+            ("---\nprofile_version: invalid\n---\n\n# Profile\n", "2.0"),  # Fallback
+        ],
+        ids=["from_1_0", "from_2_0", "without_frontmatter", "invalid_format"],
+    )
+    def test_version_from_existing_profile(self, tmp_path, content, expected):
+        """Test version increments from an existing profile's frontmatter."""
         existing_profile = tmp_path / "profile.md"
-        existing_profile.write_text("""---
-profile_version: invalid
----
-
-# Profile
-""")
+        existing_profile.write_text(content)
 
         result = determine_profile_version(existing_profile)
-        assert result == "2.0"  # Fallback
+        assert result == expected
 
 
 class TestAssemblePresenterProfile:
     """Tests for assemble_presenter_profile function."""
 
-    def test_assemble_new_profile_success(self, tmp_path):
+    @pytest.fixture
+    def stub_jinja_env(self, monkeypatch):
+        """Fixture replacing create_jinja_env with a stub env whose template renders "Profile"."""
+        env = StubEnv(StubTemplate())
+        monkeypatch.setattr(profile_assembler, "create_jinja_env", lambda: env)
+        return env
+
+    def test_assemble_new_profile_success(self, tmp_path, stub_jinja_env):
         """Test successful assembly of new profile."""
         biography_data = {
             "name": "Jane Doe",
@@ -311,20 +323,15 @@ class TestAssemblePresenterProfile:
 
         output_path = tmp_path / "people" / "janedoe.md"
 
-        # Mock the template rendering
-        with patch("casestudypilot.tools.profile_assembler.create_jinja_env") as mock_env_factory:
-            mock_env = Mock()
-            mock_template = Mock()
-            mock_template.render.return_value = "# Jane Doe\n\nRendered profile content"
-            mock_env.get_template.return_value = mock_template
-            mock_env_factory.return_value = mock_env
-
-            result = assemble_presenter_profile(
-                biography_data,
-                aggregation_data,
-                sections_data,
-                output_path=output_path,
-            )
+        stub_jinja_env.template.rendered = "# Jane Doe\n\nRendered profile content"
+
+        result = assemble_presenter_profile(
+            biography_data,
+            aggregation_data,
+            sections_data,
+            output_path=output_path,
+            base_dir=tmp_path,
+        )
 
         # Verify result
         assert result["presenter_name"] == "Jane Doe"
@@ -334,9 +341,7 @@ class TestAssemblePresenterProfile:
         assert Path(result["metadata_path"]).exists()
 
         # Verify metadata JSON
-        metadata_path = Path(result["metadata_path"])
-        with open(metadata_path) as f:
-            metadata = json.load(f)
+        metadata = json.loads(Path(result["metadata_path"]).read_bytes())
         assert metadata["name"] == "Jane Doe"
         assert metadata["github_username"] == "janedoe"
         assert metadata["profile_version"] == 1.0
@@ -352,7 +357,7 @@ class TestAssemblePresenterProfile:
         aggregation_data = {"stats": {}}
         sections_data = {}
 
-        with pytest.raises(ValueError, match="missing required 'name' field"):
+        with pytest.raises(ValueError, match=MISSING_NAME_RE):
             assemble_presenter_profile(biography_data, aggregation_data, sections_data)
 
     def test_assemble_profile_missing_github_username_error(self):
@@ -364,10 +369,10 @@ class TestAssemblePresenterProfile:
         aggregation_data = {"stats": {}}
         sections_data = {}
 
-        with pytest.raises(ValueError, match="missing required 'github_username' field"):
+        with pytest.raises(ValueError, match=MISSING_GITHUB_USERNAME_RE):
             assemble_presenter_profile(biography_data, aggregation_data, sections_data)
 
-    def test_assemble_profile_template_not_found(self, tmp_path):
+    def test_assemble_profile_template_not_found(self, stub_jinja_env):
         """Test FileNotFoundError when template not found."""
         biography_data = {
             "name": "Jane Doe",
@@ -377,15 +382,12 @@ class TestAssemblePresenterProfile:
         aggregation_data = {"stats": {}, "talk_summaries": []}
         sections_data = {}
 
-        with patch("casestudypilot.tools.profile_assembler.create_jinja_env") as mock_env_factory:
-            mock_env = Mock()
-            mock_env.get_template.side_effect = Exception("Template not found")
-            mock_env_factory.return_value = mock_env
+        stub_jinja_env.error = Exception("Template not found")
 
-            with pytest.raises(FileNotFoundError, match="Template not found"):
-                assemble_presenter_profile(biography_data, aggregation_data, sections_data)
+        with pytest.raises(FileNotFoundError, match=TEMPLATE_NOT_FOUND_RE):
+            assemble_presenter_profile(biography_data, aggregation_data, sections_data)
 
-    def test_assemble_profile_update(self, tmp_path):
+    def test_assemble_profile_update(self, tmp_path, stub_jinja_env):
         """Test profile update increments version."""
         # Create existing profile
         existing_profile = tmp_path / "people" / "janedoe.md"
@@ -406,25 +408,19 @@ profile_version: 1.0
         aggregation_data = {"stats": {}, "talk_summaries": []}
         sections_data = {}
 
-        with patch("casestudypilot.tools.profile_assembler.create_jinja_env") as mock_env_factory:
-            mock_env = Mock()
-            mock_template = Mock()
-            mock_template.render.return_value = "Updated profile"
-            mock_env.get_template.return_value = mock_template
-            mock_env_factory.return_value = mock_env
-
-            result = assemble_presenter_profile(
-                biography_data,
-                aggregation_data,
-                sections_data,
-                existing_profile_path=existing_profile,
-                output_path=tmp_path / "people" / "janedoe.md",
-            )
+        result = assemble_presenter_profile(
+            biography_data,
+            aggregation_data,
+            sections_data,
+            existing_profile_path=existing_profile,
+            output_path=tmp_path / "people" / "janedoe.md",
+            base_dir=tmp_path,
+        )
 
         # Version should be incremented
         assert result["profile_version"] == "2.0"
 
-    def test_assemble_profile_talks_by_year(self, tmp_path):
+    def test_assemble_profile_talks_by_year(self, tmp_path, stub_jinja_env):
         """Test that talks are grouped by year correctly."""
         biography_data = {
             "name": "Jane Doe",
@@ -468,35 +464,28 @@ profile_version: 1.0
         }
         sections_data = {}
 
-        with patch("casestudypilot.tools.profile_assembler.create_jinja_env") as mock_env_factory:
-            mock_env = Mock()
-            mock_template = Mock()
-            mock_template.render.return_value = "Profile"
-            mock_env.get_template.return_value = mock_template
-            mock_env_factory.return_value = mock_env
-
-            assemble_presenter_profile(
-                biography_data,
-                aggregation_data,
-                sections_data,
-                output_path=tmp_path / "profile.md",
-            )
-
-            # Check template render was called with talks_by_year
-            render_call = mock_template.render.call_args
-            context = render_call[1] if render_call[1] else render_call[0][0]
-            talks_by_year = context.get("talks_by_year", [])
-
-            # Should have 2 years
-            years = [y["year"] for y in talks_by_year]
-            assert "2024" in years
-            assert "2023" in years
-
-            # 2024 should come first (descending order)
-            assert talks_by_year[0]["year"] == "2024"
-            assert len(talks_by_year[0]["talks"]) == 2
-
-    def test_assemble_profile_duration_formatting(self, tmp_path):
+        assemble_presenter_profile(
+            biography_data,
+            aggregation_data,
+            sections_data,
+            output_path=tmp_path / "profile.md",
+            base_dir=tmp_path,
+        )
+
+        # Check template render was called with talks_by_year
+        context = stub_jinja_env.template.calls[-1]
+        talks_by_year = context.get("talks_by_year", [])
+
+        # Should have 2 years
+        years = [y["year"] for y in talks_by_year]
+        assert "2024" in years
+        assert "2023" in years
+
+        # 2024 should come first (descending order)
+        assert talks_by_year[0]["year"] == "2024"
+        assert len(talks_by_year[0]["talks"]) == 2
+
+    def test_assemble_profile_duration_formatting(self, tmp_path, stub_jinja_env):
         """Test that talk durations are formatted correctly."""
         biography_data = {
             "name": "Jane Doe",
@@ -530,30 +519,23 @@ profile_version: 1.0
         }
         sections_data = {}
 
-        with patch("casestudypilot.tools.profile_assembler.create_jinja_env") as mock_env_factory:
-            mock_env = Mock()
-            mock_template = Mock()
-            mock_template.render.return_value = "Profile"
-            mock_env.get_template.return_value = mock_template
-            mock_env_factory.return_value = mock_env
-
-            assemble_presenter_profile(
-                biography_data,
-                aggregation_data,
-                sections_data,
-                output_path=tmp_path / "profile.md",
-            )
-
-            # Check duration formatting in context
-            render_call = mock_template.render.call_args
-            context = render_call[1] if render_call[1] else render_call[0][0]
-            talks_by_year = context.get("talks_by_year", [])
-            talks = talks_by_year[0]["talks"]
-
-            assert talks[0]["duration"] == "30 minutes"
-            assert talks[1]["duration"] == "1 hour 30 minutes"
-
-    def test_assemble_profile_default_output_path(self, tmp_path):
+        assemble_presenter_profile(
+            biography_data,
+            aggregation_data,
+            sections_data,
+            output_path=tmp_path / "profile.md",
+            base_dir=tmp_path,
+        )
+
+        # Check duration formatting in context
+        context = stub_jinja_env.template.calls[-1]
+        talks_by_year = context.get("talks_by_year", [])
+        talks = talks_by_year[0]["talks"]
+
+        assert talks[0]["duration"] == "30 minutes"
+        assert talks[1]["duration"] == "1 hour 30 minutes"
+
+    def test_assemble_profile_default_output_path(self, tmp_path, stub_jinja_env):
         """Test that default output path is generated correctly."""
         biography_data = {
             "name": "Jane Doe",
@@ -563,28 +545,29 @@ profile_version: 1.0
         aggregation_data = {"stats": {}, "talk_summaries": []}
         sections_data = {}
 
-        with patch("casestudypilot.tools.profile_assembler.create_jinja_env") as mock_env_factory:
-            mock_env = Mock()
-            mock_template = Mock()
-            mock_template.render.return_value = "Profile"
-            mock_env.get_template.return_value = mock_template
-            mock_env_factory.return_value = mock_env
-
-            # Change to tmp directory for test
-            import os
-
-            original_cwd = os.getcwd()
-            try:
-                os.chdir(tmp_path)
-                result = assemble_presenter_profile(
-                    biography_data,
-                    aggregation_data,
-                    sections_data,
-                    # No output_path specified
-                )
-
-                # Should use default path
-                assert "people/janedoe.md" in result["output_path"]
-                assert "people/metadata/janedoe.json" in result["metadata_path"]
-            finally:
-                os.chdir(original_cwd)
+        result = assemble_presenter_profile(
+            biography_data,
+            aggregation_data,
+            sections_data,
+            # No output_path specified
+            base_dir=tmp_path,
+        )
+
+        # Should use default path
+        assert result["output_path"] == str(tmp_path / "people" / "janedoe.md")
+        assert result["metadata_path"] == str(tmp_path / "people" / "metadata" / "janedoe.json")
+
+    def test_assemble_profile_default_base_dir_is_cwd(self, tmp_path, monkeypatch, stub_jinja_env):
+        """Test that default output paths are relative to the current directory."""
+        biography_data = {
+            "name": "Jane Doe",
+            "github_username": "janedoe",
+            "github_data": {},
+        }
+        monkeypatch.chdir(tmp_path)
+
+        result = assemble_presenter_profile(biography_data, {"stats": {}, "talk_summaries": []}, {})
+
+        assert "people/janedoe.md" in result["output_path"]
+        assert "people/metadata/janedoe.json" in result["metadata_path"]
+        assert (tmp_path / "people" / "metadata" / "janedoe.json").exists()
@@ -2,10 +2,11 @@
 
 import json
 from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
+from unittest.mock import MagicMock, Mock, patch, mock_open
 import pytest
 
 from casestudypilot.tools.screenshot_extractor import (
+    analyze_transcript,
     analyze_transcript_for_visual_moments,
     analyze_transcript_for_metric_moments,
     select_optimal_timestamps,
@@ -114,6 +115,23 @@ def test_analyze_transcript_no_metric_moments():
     assert len(moments) == 0
 
 
+def test_analyze_transcript_matches_individual_analyzers():
+    """Test combined analysis returns the same moments as the separate analyzers."""
+    transcript_segments = [
+        {"start": 100, "text": "As you can see here, our deployment times were slow"},
+        {"start": 200, "text": "We reduced deployment time by 50% and achieved great results"},
+        {"start": 300, "text": "This is just regular talking"},
+    ]
+    key_metrics = ["50% reduction in deployment time"]
+
+    visual_moments, metric_moments = analyze_transcript(transcript_segments, {}, key_metrics)
+
+    assert visual_moments == analyze_transcript_for_visual_moments(transcript_segments, {})
+    assert metric_moments == analyze_transcript_for_metric_moments(transcript_segments, key_metrics)
+    assert [m["timestamp"] for m in visual_moments] == [100]
+    assert [m["timestamp"] for m in metric_moments] == [200]
+
+
 def test_select_optimal_timestamps_with_moments():
     """Test timestamp selection when visual moments exist."""
     visual_moments = [
@@ -223,33 +241,101 @@ def test_generate_screenshot_url():
     assert url == "https://img.youtube.com/vi/V6L-xOUdoRQ/hqdefault.jpg"
 
 
-@patch("casestudypilot.tools.screenshot_extractor.httpx.get")
-def test_download_screenshot_success(mock_get):
+def make_stream_response(chunks):
+    """Build a mock streaming response usable as a context manager."""
+    response = MagicMock()
+    response.__enter__.return_value = response
+    response.iter_bytes.return_value = iter(chunks)
+    return response
+
+
+@patch("casestudypilot.tools.screenshot_extractor.httpx.stream")
+def test_download_screenshot_success(mock_stream):
     """Test successful screenshot download."""
-    # Mock HTTP response
-    mock_response = Mock()
-    mock_response.content = b"fake image data"
-    mock_response.raise_for_status = Mock()
-    mock_get.return_value = mock_response
+    # Mock streamed HTTP response
+    mock_stream.return_value = make_stream_response([b"fake ", b"image data"])
 
     # Create temp path
     output_path = Path("/tmp/test_screenshot.jpg")
 
     # Mock file writing
-    with patch.object(Path, "write_bytes") as mock_write:
+    with patch.object(Path, "open", mock_open()) as mock_file, patch.object(Path, "replace") as mock_replace:
         with patch.object(Path, "parent", new_callable=lambda: Mock(mkdir=Mock())):
             result = download_screenshot("https://example.com/image.jpg", output_path)
 
     assert result["success"] is True
     assert result["file_size"] == 15
     assert result["url"] == "https://example.com/image.jpg"
+    mock_file().write.assert_any_call(b"fake ")
+    mock_file().write.assert_any_call(b"image data")
+    # The completed temp file is moved onto the output path
+    mock_replace.assert_called_once_with(output_path)
+
+
+@patch("casestudypilot.tools.screenshot_extractor.httpx.stream")
+def test_download_screenshot_uses_shared_client(mock_stream):
+    """Test download goes through a provided client instead of a one-off request."""
+    client = Mock()
+    client.stream.return_value = make_stream_response([b"fake image data"])
+
+    output_path = Path("/tmp/test_screenshot.jpg")
+
+    with patch.object(Path, "open", mock_open()), patch.object(Path, "replace"):
+        with patch.object(Path, "parent", new_callable=lambda: Mock(mkdir=Mock())):
+            result = download_screenshot("https://example.com/image.jpg", output_path, client=client)
+
+    assert result["success"] is True
+    assert result["file_size"] == 15
+    client.stream.assert_called_once_with("GET", "https://example.com/image.jpg")
+    mock_stream.assert_not_called()
+
+
+@patch("casestudypilot.tools.screenshot_extractor.httpx.stream")
+def test_download_screenshot_http_error_skips_write(mock_stream):
+    """Test an HTTP error status is reported without opening the output file."""
+    response = make_stream_response([])
+    response.raise_for_status.side_effect = Exception("404 Not Found")
+    mock_stream.return_value = response
+
+    output_path = Path("/tmp/test_screenshot.jpg")
+
+    with patch.object(Path, "open", mock_open()) as mock_file:
+        with patch.object(Path, "parent", new_callable=lambda: Mock(mkdir=Mock())):
+            result = download_screenshot("https://example.com/image.jpg", output_path)
+
+    assert result["success"] is False
+    assert "404" in result["error"]
+    mock_file.assert_not_called()
+
+
+@patch("casestudypilot.tools.screenshot_extractor.httpx.stream")
+def test_download_screenshot_interrupted_keeps_existing_file(mock_stream, tmp_path):
+    """Test a download that fails mid-stream leaves the existing file untouched and no partial file behind."""
+
+    def interrupted_body(chunk_size):
+        yield b"partial"
+        raise Exception("Connection reset")
+
+    response = make_stream_response([])
+    response.iter_bytes.side_effect = interrupted_body
+    mock_stream.return_value = response
+
+    output_path = tmp_path / "screenshot.jpg"
+    output_path.write_bytes(b"good image")
+
+    result = download_screenshot("https://example.com/image.jpg", output_path)
+
+    assert result["success"] is False
+    assert "Connection reset" in result["error"]
+    assert output_path.read_bytes() == b"good image"
+    assert list(tmp_path.iterdir()) == [output_path]
 
 
-@patch("casestudypilot.tools.screenshot_extractor.httpx.get")
-def test_download_screenshot_failure(mock_get):
+@patch("casestudypilot.tools.screenshot_extractor.httpx.stream")
+def test_download_screenshot_failure(mock_stream):
     """Test screenshot download failure."""
     # Mock HTTP error
-    mock_get.side_effect = Exception("Network error")
+    mock_stream.side_effect = Exception("Network error")
 
     output_path = Path("/tmp/test_screenshot.jpg")
 
@@ -1,297 +1,196 @@
 """Unit tests for validate_deep_analysis tool."""
 
+import copy
 import pytest
 import json
-import tempfile
-from pathlib import Path
-from casestudypilot.tools.validate_deep_analysis import validate_deep_analysis, main
+from casestudypilot.tools.validate_deep_analysis import (
+    validate_deep_analysis,
+    validate_deep_analysis_bytes,
+    main,
+)
+from tests._validator_contract import assert_file_not_found, assert_validation_result
+
+# Section bodies of a given word count; strings are immutable, so every section can reuse the same object
+WORDS_150 = ("word " * 150)[:-1]
+WORDS_300 = ("word " * 300)[:-1]
+WORDS_900 = ("word " * 900)[:-1]
+
+# (mutation applied to a copy of the valid analysis, expected exit code, expected message substrings)
+VALIDATION_CASES = [
+    pytest.param(
+        lambda d: d.update(cncf_projects=d["cncf_projects"][:3]),
+        2,
+        ["Less than 4 CNCF projects"],
+        id="less_than_4_projects_fails",
+    ),
+    pytest.param(
+        lambda d: d.update(cncf_projects=d["cncf_projects"][:4]),
+        1,
+        ["4 CNCF projects", "5 recommended"],
+        id="exactly_4_projects_warns",
+    ),
+    pytest.param(
+        lambda d: d["architecture_components"].pop("infrastructure_layer"),
+        2,
+        ["infrastructure_layer"],
+        id="missing_infrastructure_layer_fails",
+    ),
+    pytest.param(
+        lambda d: d["architecture_components"].update(platform_layer=[]),
+        2,
+        ["platform_layer", "empty"],
+        id="empty_platform_layer_fails",
+    ),
+    pytest.param(
+        lambda d: d.update(integration_patterns=[]),
+        2,
+        ["No integration patterns"],
+        id="no_integration_patterns_fails",
+    ),
+    pytest.param(
+        lambda d: d.update(integration_patterns=d["integration_patterns"][:1]),
+        1,
+        ["Only 1 integration pattern"],
+        id="one_integration_pattern_warns",
+    ),
+    pytest.param(
+        lambda d: d["technical_metrics"][0].pop("transcript_quote"),
+        2,
+        ["missing 'transcript_quote'"],
+        id="metric_without_transcript_quote_fails",
+    ),
+    pytest.param(
+        lambda d: d["technical_metrics"][0].update(transcript_quote=""),
+        2,
+        ["empty or too-short transcript quote"],
+        id="metric_with_empty_transcript_quote_fails",
+    ),
+    pytest.param(
+        lambda d: d.update(screenshot_opportunities=d["screenshot_opportunities"][:3]),
+        2,
+        ["Less than 4 screenshot opportunities"],
+        id="less_than_4_screenshots_fails",
+    ),
+    pytest.param(
+        lambda d: d.update(screenshot_opportunities=d["screenshot_opportunities"][:5]),
+        1,
+        ["5 screenshot opportunities", "6 recommended"],
+        id="5_screenshots_warns",
+    ),
+    pytest.param(
+        lambda d: d["sections"].pop("technical_challenge"),
+        2,
+        ["Missing section 'technical_challenge'"],
+        id="missing_section_fails",
+    ),
+    pytest.param(
+        lambda d: d["sections"].update(background=WORDS_150),
+        1,
+        ["background", "150 words", "200-800 recommended"],
+        id="section_too_short_warns",
+    ),
+    pytest.param(
+        lambda d: d["sections"].update(implementation_details=WORDS_900),
+        1,
+        ["implementation_details", "900 words", "200-800 recommended"],
+        id="section_too_long_warns",
+    ),
+]
+
+
+@pytest.fixture(scope="class")
+def valid_deep_analysis():
+    """Fixture providing a valid deep analysis structure, built once and shared read-only."""
+    return {
+        "cncf_projects": [
+            {"name": "Kubernetes", "usage_context": "container orchestration"},
+            {"name": "Prometheus", "usage_context": "monitoring"},
+            {"name": "Envoy", "usage_context": "service mesh"},
+            {"name": "Helm", "usage_context": "package management"},
+            {"name": "etcd", "usage_context": "distributed key-value store"},
+        ],
+        "architecture_components": {
+            "infrastructure_layer": [{"component": "Kubernetes Cluster", "description": "Core platform"}],
+            "platform_layer": [{"component": "Prometheus", "description": "Metrics collection"}],
+            "application_layer": [{"component": "Microservices", "description": "Business logic"}],
+        },
+        "integration_patterns": [
+            {"pattern": "Service Mesh", "description": "Envoy-based communication"},
+            {"pattern": "GitOps", "description": "Automated deployments"},
+        ],
+        "technical_metrics": [
+            {
+                "metric": "Deployment time",
+                "value": "2 minutes",
+                "transcript_quote": "We reduced deployment time from 30 minutes to 2 minutes",
+            }
+        ],
+        "screenshot_opportunities": [
+            {"timestamp": "1:23", "description": "Architecture diagram"},
+            {"timestamp": "2:45", "description": "Dashboard view"},
+            {"timestamp": "3:12", "description": "Deployment pipeline"},
+            {"timestamp": "4:30", "description": "Monitoring graphs"},
+            {"timestamp": "5:00", "description": "Service mesh topology"},
+            {"timestamp": "6:15", "description": "Performance metrics"},
+        ],
+        "sections": {
+            "background": WORDS_300,  # 300 words
+            "technical_challenge": WORDS_300,
+            "architecture_overview": WORDS_300,
+            "implementation_details": WORDS_300,
+            "results_and_impact": WORDS_300,
+            "lessons_learned": WORDS_300,
+        },
+    }
+
+
+@pytest.fixture(scope="class")
+def valid_json_path(tmp_path_factory, valid_deep_analysis):
+    """Fixture writing the valid analysis to a JSON file once for the read-only file tests."""
+    path = tmp_path_factory.mktemp("deep_analysis") / "deep_analysis.json"
+    path.write_text(json.dumps(valid_deep_analysis))
+    return path
 
 
 class TestValidateDeepAnalysis:
     """Tests for deep analysis validation."""
 
     @pytest.fixture
-    def valid_deep_analysis(self):
-        """Fixture providing a valid deep analysis structure."""
-        return {
-            "cncf_projects": [
-                {"name": "Kubernetes", "usage_context": "container orchestration"},
-                {"name": "Prometheus", "usage_context": "monitoring"},
-                {"name": "Envoy", "usage_context": "service mesh"},
-                {"name": "Helm", "usage_context": "package management"},
-                {"name": "etcd", "usage_context": "distributed key-value store"},
-            ],
-            "architecture_components": {
-                "infrastructure_layer": [{"component": "Kubernetes Cluster", "description": "Core platform"}],
-                "platform_layer": [{"component": "Prometheus", "description": "Metrics collection"}],
-                "application_layer": [{"component": "Microservices", "description": "Business logic"}],
-            },
-            "integration_patterns": [
-                {"pattern": "Service Mesh", "description": "Envoy-based communication"},
-                {"pattern": "GitOps", "description": "Automated deployments"},
-            ],
-            "technical_metrics": [
-                {
-                    "metric": "Deployment time",
-                    "value": "2 minutes",
-                    "transcript_quote": "We reduced deployment time from 30 minutes to 2 minutes",
-                }
-            ],
-            "screenshot_opportunities": [
-                {"timestamp": "1:23", "description": "Architecture diagram"},
-                {"timestamp": "2:45", "description": "Dashboard view"},
-                {"timestamp": "3:12", "description": "Deployment pipeline"},
-                {"timestamp": "4:30", "description": "Monitoring graphs"},
-                {"timestamp": "5:00", "description": "Service mesh topology"},
-                {"timestamp": "6:15", "description": "Performance metrics"},
-            ],
-            "sections": {
-                "background": " ".join(["word"] * 300),  # 300 words
-                "technical_challenge": " ".join(["word"] * 300),
-                "architecture_overview": " ".join(["word"] * 300),
-                "implementation_details": " ".join(["word"] * 300),
-                "results_and_impact": " ".join(["word"] * 300),
-                "lessons_learned": " ".join(["word"] * 300),
-            },
-        }
+    def mutable_deep_analysis(self, valid_deep_analysis):
+        """Fixture providing a private deep copy of the valid analysis for tests that modify it."""
+        return copy.deepcopy(valid_deep_analysis)
 
     def test_file_not_found_returns_error(self):
         """Test that missing file returns exit code 2."""
-        exit_code = main("/nonexistent/file.json")
-        assert exit_code == 2
+        assert_file_not_found(main)
 
-    def test_valid_deep_analysis_passes(self, valid_deep_analysis):
+    def test_valid_deep_analysis_passes(self, valid_json_path):
         """Test that valid deep analysis returns exit code 0."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 0
-            assert "Validation passed" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_invalid_json_fails(self):
-        """Test that invalid JSON returns exit code 2."""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            f.write("{invalid json")
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "Invalid JSON" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_less_than_4_projects_fails(self, valid_deep_analysis):
-        """Test that less than 4 CNCF projects returns exit code 2."""
-        valid_deep_analysis["cncf_projects"] = valid_deep_analysis["cncf_projects"][:3]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "Less than 4 CNCF projects" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_exactly_4_projects_warns(self, valid_deep_analysis):
-        """Test that exactly 4 CNCF projects returns exit code 1."""
-        valid_deep_analysis["cncf_projects"] = valid_deep_analysis["cncf_projects"][:4]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 1
-            assert "4 CNCF projects" in message
-            assert "5 recommended" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_missing_infrastructure_layer_fails(self, valid_deep_analysis):
-        """Test that missing infrastructure layer returns exit code 2."""
-        del valid_deep_analysis["architecture_components"]["infrastructure_layer"]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "infrastructure_layer" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_empty_platform_layer_fails(self, valid_deep_analysis):
-        """Test that empty platform layer returns exit code 2."""
-        valid_deep_analysis["architecture_components"]["platform_layer"] = []
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "platform_layer" in message
-            assert "empty" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_no_integration_patterns_fails(self, valid_deep_analysis):
-        """Test that no integration patterns returns exit code 2."""
-        valid_deep_analysis["integration_patterns"] = []
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "No integration patterns" in message
-        finally:
-            Path(temp_path).unlink()
+        assert_validation_result(validate_deep_analysis(valid_json_path), 0, "Validation passed")
 
-    def test_one_integration_pattern_warns(self, valid_deep_analysis):
-        """Test that only 1 integration pattern returns exit code 1."""
-        valid_deep_analysis["integration_patterns"] = [valid_deep_analysis["integration_patterns"][0]]
+    def test_valid_deep_analysis_dict_passes(self, valid_deep_analysis):
+        """Test that an already-parsed analysis dict is validated without a file."""
+        assert_validation_result(validate_deep_analysis(valid_deep_analysis), 0, "Validation passed")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
+    def test_valid_deep_analysis_bytes_passes(self, valid_deep_analysis):
+        """Test that encoded JSON bytes are validated without a file."""
+        raw = json.dumps(valid_deep_analysis).encode()
+        assert_validation_result(validate_deep_analysis_bytes(raw), 0, "Validation passed")
 
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 1
-            assert "Only 1 integration pattern" in message
-        finally:
-            Path(temp_path).unlink()
+    def test_invalid_json_bytes_fails(self):
+        """Test that malformed JSON bytes return exit code 2."""
+        assert_validation_result(validate_deep_analysis_bytes(b"{invalid json"), 2, "Invalid JSON")
 
-    def test_metric_without_transcript_quote_fails(self, valid_deep_analysis):
-        """Test that metric without transcript_quote returns exit code 2."""
-        valid_deep_analysis["technical_metrics"][0] = {
-            "metric": "Deployment time",
-            "value": "2 minutes",
-            # Missing transcript_quote
-        }
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "missing 'transcript_quote'" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_metric_with_empty_transcript_quote_fails(self, valid_deep_analysis):
-        """Test that metric with empty transcript_quote returns exit code 2."""
-        valid_deep_analysis["technical_metrics"][0]["transcript_quote"] = ""
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "empty or too-short transcript quote" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_less_than_4_screenshots_fails(self, valid_deep_analysis):
-        """Test that less than 4 screenshots returns exit code 2."""
-        valid_deep_analysis["screenshot_opportunities"] = [
-            {"timestamp": "1:23", "description": "Architecture diagram"},
-            {"timestamp": "2:45", "description": "Dashboard view"},
-            {"timestamp": "3:12", "description": "Deployment pipeline"},
-        ]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "Less than 4 screenshot opportunities" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_5_screenshots_warns(self, valid_deep_analysis):
-        """Test that 5 screenshots returns exit code 1."""
-        valid_deep_analysis["screenshot_opportunities"] = valid_deep_analysis["screenshot_opportunities"][:5]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 1
-            assert "5 screenshot opportunities" in message
-            assert "6 recommended" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_missing_section_fails(self, valid_deep_analysis):
-        """Test that missing required section returns exit code 2."""
-        del valid_deep_analysis["sections"]["technical_challenge"]
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 2
-            assert "Missing section 'technical_challenge'" in message
-        finally:
-            Path(temp_path).unlink()
-
-    def test_section_too_short_warns(self, valid_deep_analysis):
-        """Test that section with < 200 words returns exit code 1."""
-        valid_deep_analysis["sections"]["background"] = " ".join(["word"] * 150)  # 150 words
-
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
-
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 1
-            assert "background" in message
-            assert "150 words" in message
-            assert "200-800 recommended" in message
-        finally:
-            Path(temp_path).unlink()
+    def test_invalid_json_fails(self, tmp_path):
+        """Test that invalid JSON returns exit code 2."""
+        invalid_path = tmp_path / "invalid.json"
+        invalid_path.write_text("{invalid json")
 
-    def test_section_too_long_warns(self, valid_deep_analysis):
-        """Test that section with > 800 words returns exit code 1."""
-        valid_deep_analysis["sections"]["implementation_details"] = " ".join(["word"] * 900)  # 900 words
+        assert_validation_result(validate_deep_analysis(invalid_path), 2, "Invalid JSON")
 
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".json", delete=False) as f:
-            json.dump(valid_deep_analysis, f)
-            temp_path = f.name
+    @pytest.mark.parametrize("mutate,expected_code,expected_substrings", VALIDATION_CASES)
+    def test_validation_case(self, mutable_deep_analysis, mutate, expected_code, expected_substrings):
+        """Test that a single-field change yields the expected exit code and message."""
+        mutate(mutable_deep_analysis)
 
-        try:
-            exit_code, message = validate_deep_analysis(Path(temp_path))
-            assert exit_code == 1
-            assert "implementation_details" in message
-            assert "900 words" in message
-            assert "200-800 recommended" in message
-        finally:
-            Path(temp_path).unlink()
+        assert_validation_result(validate_deep_analysis(mutable_deep_analysis), expected_code, *expected_substrings)
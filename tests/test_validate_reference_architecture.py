@@ -2,13 +2,13 @@
 
 import pytest
 import json
-import tempfile
 from pathlib import Path
 from casestudypilot.tools.validate_reference_architecture import (
     calculate_technical_depth_score,
     validate_reference_architecture,
     main,
 )
+from tests._validator_contract import assert_file_not_found
 
 
 class TestTechnicalDepthScoring:
@@ -35,8 +35,7 @@ class TestValidateReferenceArchitecture:
 
     def test_file_not_found_returns_error(self):
         """Test that missing file returns exit code 2."""
-        exit_code = main("/nonexistent/file.json")
-        assert exit_code == 2
+        assert_file_not_found(main)
 
     # TODO: Add comprehensive tests:
     # - test_valid_reference_architecture_passes()
@@ -1,9 +1,6 @@
 """Unit tests for validation framework."""
 
 import pytest
-import tempfile
-import os
-from pathlib import Path
 from casestudypilot.validation import (
     validate_transcript,
     validate_company_name,
@@ -12,27 +9,53 @@ from casestudypilot.validation import (
     validate_company_consistency,
     validate_case_study_format,
     Severity,
+    ValidationCheck,
+    ValidationResult,
 )
 
+# Shared test text, built once; strings are immutable, so tests can reuse them freely
+SECTION_TEXT = "test" * 30  # 120 chars, long enough for a section
+SECTION_KEYS = ("background", "challenge", "solution", "impact")
+SECTIONS = dict.fromkeys(SECTION_KEYS, SECTION_TEXT)
+TRANSCRIPT_TEXT = "This is a transcript. " * 100
+DETAILED_TRANSCRIPT = "This is a detailed transcript about Kubernetes and cloud native technologies. " * 100
+SHORT_VALID_TRANSCRIPT = "Valid transcript content. " * 100  # 2600 chars, < 5000
+SEGMENTS_100 = [{"text": f"segment {i}", "start": i, "duration": 1} for i in range(100)]  # read-only
+A_SEGMENTS_60 = [{"text": "a", "start": i, "duration": 1} for i in range(60)]  # read-only
 
-class TestValidateTranscript:
-    """Tests for transcript validation."""
 
-    def test_valid_transcript_passes(self):
-        """Test transcript validation with good data."""
-        transcript = (
-            "This is a detailed transcript about Kubernetes and cloud native technologies. "
-            * 100
-        )
-        segments = [
-            {"text": f"segment {i}", "start": i, "duration": 1} for i in range(100)
-        ]
+def has_failure(result, *needles):
+    """Return True if one failed check's message contains every needle, case-insensitively."""
+    needles = [needle.lower() for needle in needles]
+    for check in result.checks:
+        if not check.passed and check.message:
+            message = check.message.lower()
+            if all(needle in message for needle in needles):
+                return True
+    return False
 
-        result = validate_transcript(transcript, segments)
 
-        assert result.status == Severity.PASS
+class TestValidateTranscript:
+    """Tests for transcript validation."""
+
+    @pytest.mark.parametrize(
+        "transcript,expected_status,warning_substring",
+        [
+            (DETAILED_TRANSCRIPT, Severity.PASS, None),
+            (SHORT_VALID_TRANSCRIPT, Severity.WARNING, "short transcript"),
+        ],
+        ids=["valid_transcript_passes", "short_but_valid_transcript_warns"],
+    )
+    def test_transcript_length(self, transcript, expected_status, warning_substring):
+        """Test transcript length checks: long transcripts pass, short but valid ones warn."""
+        result = validate_transcript(transcript, SEGMENTS_100)
+
+        # Should pass critical checks either way
+        assert result.status == expected_status
         assert not result.is_critical()
-        assert not result.has_warnings()
+        assert result.has_warnings() == (warning_substring is not None)
+        if warning_substring:
+            assert has_failure(result, warning_substring)
 
     def test_empty_transcript_fails_critically(self):
         """Test empty transcript fails critically."""
@@ -40,11 +63,7 @@ class TestValidateTranscript:
 
         assert result.status == Severity.CRITICAL
         assert result.is_critical()
-        assert any(
-            "empty" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "empty")
 
     def test_short_transcript_fails_critically(self):
         """Test short transcript fails critically."""
@@ -54,15 +73,11 @@ class TestValidateTranscript:
         result = validate_transcript(transcript, segments)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "too short" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "too short")
 
     def test_few_segments_fails_critically(self):
         """Test too few segments fails critically."""
-        transcript = "This is a transcript. " * 100  # Long enough text
+        transcript = TRANSCRIPT_TEXT  # Long enough text
         segments = [
             {"text": "segment", "start": 0, "duration": 1}
         ] * 10  # Only 10 segments
@@ -70,44 +85,16 @@ class TestValidateTranscript:
         result = validate_transcript(transcript, segments)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "few" in c.message.lower() and "segment" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
-
-    def test_short_but_valid_transcript_warns(self):
-        """Test short but valid transcript produces warning."""
-        transcript = "Valid transcript content. " * 100  # 2700 chars, < 5000
-        segments = [
-            {"text": f"segment {i}", "start": i, "duration": 1} for i in range(100)
-        ]
-
-        result = validate_transcript(transcript, segments)
-
-        # Should pass critical checks but have warning
-        assert result.status == Severity.WARNING
-        assert not result.is_critical()
-        assert result.has_warnings()
-        assert any(
-            "short transcript" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "few", "segment")
 
     def test_no_meaningful_content_fails(self):
         """Test transcript without meaningful content fails."""
         transcript = "a b c d e"  # Very few words
-        segments = [{"text": "a", "start": i, "duration": 1} for i in range(60)]
 
-        result = validate_transcript(transcript, segments)
+        result = validate_transcript(transcript, A_SEGMENTS_60)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "meaningful content" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "meaningful content")
 
 
 class TestValidateCompanyName:
@@ -122,63 +109,41 @@ class TestValidateCompanyName:
         assert result.status == Severity.PASS
         assert not result.is_critical()
 
-    def test_generic_company_name_fails(self):
+    @pytest.mark.parametrize("name", ["Company", "Organization", "Tech", "Unknown", "TBD"])
+    def test_generic_company_name_fails(self, name):
         """Test generic company names fail."""
-        generic_names = ["Company", "Organization", "Tech", "Unknown", "TBD"]
-
-        for name in generic_names:
-            result = validate_company_name(name, "Some video title")
+        result = validate_company_name(name, "Some video title")
 
-            assert result.status == Severity.CRITICAL
-            assert any(
-                "generic" in c.message.lower()
-                for c in result.get_failed_checks()
-                if c.message
-            )
+        assert result.status == Severity.CRITICAL
+        assert has_failure(result, "generic")
 
     def test_empty_company_name_fails(self):
         """Test empty company name fails."""
         result = validate_company_name("", "Some video title")
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "no company name" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "no company name")
 
     def test_short_company_name_fails(self):
         """Test very short company name fails."""
         result = validate_company_name("X", "Some video title")
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "too short" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "too short")
 
     def test_low_confidence_fails_critically(self):
         """Test low confidence (< 0.5) fails critically."""
         result = validate_company_name("SomeCompany", "Video title", confidence=0.3)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "low confidence" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "low confidence")
 
     def test_medium_confidence_warns(self):
         """Test medium confidence (0.5-0.7) produces warning."""
         result = validate_company_name("SomeCompany", "Video title", confidence=0.6)
 
         assert result.status == Severity.WARNING
-        assert any(
-            "low confidence" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "low confidence")
 
     def test_high_confidence_passes(self):
         """Test high confidence (>= 0.7) passes."""
@@ -190,33 +155,20 @@ class TestValidateCompanyName:
 class TestValidateAnalysis:
     """Tests for analysis validation."""
 
-    def test_valid_analysis_passes(self):
-        """Test valid analysis passes."""
-        analysis = {
-            "cncf_projects": [
-                {"name": "Kubernetes", "usage_context": "orchestration"},
-                {"name": "Argo CD", "usage_context": "GitOps"},
-            ],
-            "key_metrics": [
-                {
-                    "value": "50%",
-                    "type": "percentage",
-                    "context": "deployment time reduction",
-                }
-            ],
-            "sections": {
-                "background": "Company background information with sufficient detail to understand context and business needs."
-                * 2,
-                "challenge": "Technical challenges faced by the organization requiring cloud native solutions and modernization."
-                * 2,
-                "solution": "Implementation approach using CNCF technologies to solve the problems and achieve goals."
-                * 2,
-                "impact": "Measurable results and business outcomes from the cloud native transformation and adoption."
-                * 2,
-            },
+    @pytest.fixture
+    def good_analysis(self):
+        """Fixture providing a fresh baseline analysis that each test adjusts one field of."""
+        return {
+            "cncf_projects": [{"name": "Kubernetes", "usage_context": "orchestration"}],
+            "key_metrics": [{"value": "50%", "type": "percentage", "context": "deployment time reduction"}],
+            "sections": dict(SECTIONS),
         }
 
-        result = validate_analysis(analysis)
+    def test_valid_analysis_passes(self, good_analysis):
+        """Test valid analysis passes."""
+        good_analysis["cncf_projects"].append({"name": "Argo CD", "usage_context": "GitOps"})
+
+        result = validate_analysis(good_analysis)
 
         assert result.status == Severity.PASS
         assert not result.is_critical()
@@ -231,120 +183,51 @@ class TestValidateAnalysis:
         result = validate_analysis(analysis)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "missing required keys" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "missing required keys")
 
-    def test_no_cncf_projects_fails(self):
+    def test_no_cncf_projects_fails(self, good_analysis):
         """Test analysis with no CNCF projects fails."""
-        analysis = {
-            "cncf_projects": [],
-            "key_metrics": [],
-            "sections": {
-                "background": "test" * 30,
-                "challenge": "test" * 30,
-                "solution": "test" * 30,
-                "impact": "test" * 30,
-            },
-        }
+        good_analysis["cncf_projects"] = []
 
-        result = validate_analysis(analysis)
+        result = validate_analysis(good_analysis)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "no cncf projects" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "no cncf projects")
 
-    def test_only_one_project_warns(self):
+    def test_only_one_project_warns(self, good_analysis):
         """Test analysis with only 1 project produces warning."""
-        analysis = {
-            "cncf_projects": [{"name": "Kubernetes", "usage_context": "orchestration"}],
-            "key_metrics": [{"value": "50%", "type": "percentage"}],
-            "sections": {
-                "background": "test" * 30,
-                "challenge": "test" * 30,
-                "solution": "test" * 30,
-                "impact": "test" * 30,
-            },
-        }
-
-        result = validate_analysis(analysis)
+        result = validate_analysis(good_analysis)
 
         assert result.status == Severity.WARNING
-        assert any(
-            "only 1 cncf project" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "only 1 cncf project")
 
-    def test_missing_sections_fails(self):
+    def test_missing_sections_fails(self, good_analysis):
         """Test missing sections fails."""
-        analysis = {
-            "cncf_projects": [{"name": "Kubernetes", "usage_context": "orchestration"}],
-            "key_metrics": [],
-            "sections": {
-                "background": "test" * 30
-                # Missing challenge, solution, impact
-            },
-        }
+        good_analysis["sections"] = {"background": SECTION_TEXT}  # Missing challenge, solution, impact
 
-        result = validate_analysis(analysis)
+        result = validate_analysis(good_analysis)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "missing required sections" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "missing required sections")
 
-    def test_short_sections_fail(self):
+    def test_short_sections_fail(self, good_analysis):
         """Test sections with insufficient content fail."""
-        analysis = {
-            "cncf_projects": [{"name": "Kubernetes", "usage_context": "orchestration"}],
-            "key_metrics": [],
-            "sections": {
-                "background": "short",  # < 100 chars
-                "challenge": "test" * 30,
-                "solution": "test" * 30,
-                "impact": "test" * 30,
-            },
-        }
+        good_analysis["sections"]["background"] = "short"  # < 100 chars
 
-        result = validate_analysis(analysis)
+        result = validate_analysis(good_analysis)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "too short" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "too short")
 
-    def test_no_metrics_warns(self):
+    def test_no_metrics_warns(self, good_analysis):
         """Test no metrics produces warning."""
-        analysis = {
-            "cncf_projects": [{"name": "Kubernetes", "usage_context": "orchestration"}],
-            "key_metrics": [],  # No metrics
-            "sections": {
-                "background": "test" * 30,
-                "challenge": "test" * 30,
-                "solution": "test" * 30,
-                "impact": "test" * 30,
-            },
-        }
+        good_analysis["key_metrics"] = []  # No metrics
 
-        result = validate_analysis(analysis)
+        result = validate_analysis(good_analysis)
 
         # Should have warning about no metrics (but may also have warning about 1 project)
         assert result.has_warnings()
-        assert any(
-            "no quantitative metrics" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "no quantitative metrics")
 
 
 class TestValidateMetrics:
@@ -377,11 +260,7 @@ class TestValidateMetrics:
 
         assert result.status == Severity.WARNING
         assert result.has_warnings()
-        assert any(
-            "don't appear in transcript" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "don't appear in transcript")
 
     def test_fuzzy_matching_allows_variations(self):
         """Test fuzzy matching allows reasonable variations."""
@@ -426,11 +305,7 @@ class TestValidateCompanyConsistency:
 
         assert result.status == Severity.CRITICAL
         assert result.is_critical()
-        assert any(
-            "mismatch" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "mismatch")
 
     def test_expected_company_not_mentioned_fails(self):
         """Test expected company not mentioned fails."""
@@ -443,11 +318,7 @@ class TestValidateCompanyConsistency:
         result = validate_company_consistency("Intuit", generated, video_data)
 
         assert result.status == Severity.CRITICAL
-        assert any(
-            "not mentioned" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
-        )
+        assert has_failure(result, "not mentioned")
 
     def test_other_companies_as_partners_warns(self):
         """Test mentioning other companies as partners/competitors produces warning."""
@@ -465,11 +336,7 @@ class TestValidateCompanyConsistency:
         # (Intuit is mentioned more than others)
         assert result.status in [Severity.WARNING, Severity.PASS]
         if result.status == Severity.WARNING:
-            assert any(
-                "other companies mentioned" in c.message.lower()
-                for c in result.get_failed_checks()
-                if c.message
-            )
+            assert has_failure(result, "other companies mentioned")
 
 
 class TestValidationResult:
@@ -477,8 +344,6 @@ class TestValidationResult:
 
     def test_is_critical_detects_critical_status(self):
         """Test is_critical() method."""
-        from casestudypilot.validation import ValidationResult, ValidationCheck
-
         result = ValidationResult(
             status=Severity.CRITICAL,
             checks=[ValidationCheck("test", False, Severity.CRITICAL, "Failed")],
@@ -488,8 +353,6 @@ class TestValidationResult:
 
     def test_has_warnings_detects_warnings(self):
         """Test has_warnings() method."""
-        from casestudypilot.validation import ValidationResult, ValidationCheck
-
         result = ValidationResult(
             status=Severity.WARNING,
             checks=[
@@ -502,8 +365,6 @@ class TestValidationResult:
 
     def test_get_failed_checks_returns_only_failures(self):
         """Test get_failed_checks() method."""
-        from casestudypilot.validation import ValidationResult, ValidationCheck
-
         result = ValidationResult(
             status=Severity.WARNING,
             checks=[
@@ -520,8 +381,6 @@ class TestValidationResult:
 
     def test_to_dict_serialization(self):
         """Test to_dict() serialization."""
-        from casestudypilot.validation import ValidationResult, ValidationCheck
-
         result = ValidationResult(
             status=Severity.PASS,
             checks=[
@@ -543,9 +402,24 @@ class TestValidationResult:
 class TestValidateCaseStudyFormat:
     """Tests for case study format validation (images and links)."""
 
-    def test_relative_image_paths_pass(self):
-        """Test case study with relative image paths passes."""
-        content = """# Company Case Study
+    pytestmark = pytest.mark.io
+
+    @pytest.fixture
+    def md_file(self, tmp_path):
+        """Fixture returning a function that writes markdown into tmp_path and returns the file path."""
+
+        def write(content):
+            path = tmp_path / "case_study.md"
+            path.write_text(content, encoding="utf-8")
+            return str(path)
+
+        return write
+
+    @pytest.mark.parametrize(
+        "content,expected_status,check_name,check_passed,message_substring",
+        [
+            (
+                """# Company Case Study
 
 ## Challenge
 
@@ -556,80 +430,40 @@ class TestValidateCaseStudyFormat:
 
 [![Screenshot](images/company/solution.jpg)](https://www.youtube.com/watch?v=ABC123&t=500s)
 *Solution screenshot (8:20)*
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_path = f.name
-
-        try:
-            result = validate_case_study_format(temp_path)
-
-            assert result.status == Severity.PASS
-            assert not result.is_critical()
-            # Check that relative_image_paths check passed
-            assert any(
-                c.name == "relative_image_paths" and c.passed for c in result.checks
-            )
-        finally:
-            os.unlink(temp_path)
-
-    def test_absolute_image_paths_fail(self):
-        """Test case study with absolute image paths fails critically."""
-        content = """# Company Case Study
+""",
+                Severity.PASS,
+                "relative_image_paths",
+                True,
+                None,
+            ),
+            (
+                """# Company Case Study
 
 ## Challenge
 
 [![Screenshot](case-studies/images/company/challenge.jpg)](https://www.youtube.com/watch?v=ABC123&t=109s)
 *Challenge screenshot (1:49)*
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_path = f.name
-
-        try:
-            result = validate_case_study_format(temp_path)
-
-            assert result.status == Severity.CRITICAL
-            assert result.is_critical()
-            # Check that relative_image_paths check failed
-            failed = result.get_failed_checks()
-            assert any(
-                c.name == "relative_image_paths"
-                and "absolute paths" in c.message.lower()
-                for c in failed
-                if c.message
-            )
-        finally:
-            os.unlink(temp_path)
-
-    def test_clickable_screenshot_links_pass(self):
-        """Test case study with clickable screenshot links passes."""
-        content = """# Company Case Study
+""",
+                Severity.CRITICAL,
+                "relative_image_paths",
+                False,
+                "absolute paths",
+            ),
+            (
+                """# Company Case Study
 
 ## Challenge
 
 [![Screenshot caption](images/company/challenge.jpg)](https://www.youtube.com/watch?v=ABC123&t=109s)
 *Challenge screenshot (1:49)*
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_path = f.name
-
-        try:
-            result = validate_case_study_format(temp_path)
-
-            assert result.status == Severity.PASS
-            # Check that clickable_screenshot_links check passed
-            assert any(
-                c.name == "clickable_screenshot_links" and c.passed
-                for c in result.checks
-            )
-        finally:
-            os.unlink(temp_path)
-
-    def test_non_clickable_screenshots_fail(self):
-        """Test case study with non-clickable screenshots fails critically."""
-        content = """# Company Case Study
+""",
+                Severity.PASS,
+                "clickable_screenshot_links",
+                True,
+                None,
+            ),
+            (
+                """# Company Case Study
 
 ## Challenge
 
@@ -637,28 +471,34 @@ class TestValidateCaseStudyFormat:
 *Challenge screenshot*
 
 Some text here.
-"""
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_path = f.name
-
-        try:
-            result = validate_case_study_format(temp_path)
-
-            assert result.status == Severity.CRITICAL
-            assert result.is_critical()
-            # Check that clickable_screenshot_links check failed
-            failed = result.get_failed_checks()
-            assert any(
-                c.name == "clickable_screenshot_links"
-                and "non-clickable" in c.message.lower()
-                for c in failed
-                if c.message
-            )
-        finally:
-            os.unlink(temp_path)
-
-    def test_valid_timestamps_pass(self):
+""",
+                Severity.CRITICAL,
+                "clickable_screenshot_links",
+                False,
+                "non-clickable",
+            ),
+        ],
+        ids=[
+            "relative_image_paths_pass",
+            "absolute_image_paths_fail",
+            "clickable_screenshot_links_pass",
+            "non_clickable_screenshots_fail",
+        ],
+    )
+    def test_screenshot_markup(self, md_file, content, expected_status, check_name, check_passed, message_substring):
+        """Test image path and screenshot link checks on passing and failing markup."""
+        result = validate_case_study_format(md_file(content))
+
+        assert result.status == expected_status
+        assert result.is_critical() == (expected_status == Severity.CRITICAL)
+        assert any(
+            c.name == check_name
+            and c.passed == check_passed
+            and (message_substring is None or message_substring in c.message.lower())
+            for c in result.checks
+        )
+
+    def test_valid_timestamps_pass(self, md_file):
         """Test case study with valid timestamps passes."""
         content = """# Company Case Study
 
@@ -666,20 +506,13 @@ Some text here.
 [![Screenshot 2](images/company/solution.jpg)](https://www.youtube.com/watch?v=ABC123&t=100s)
 [![Screenshot 3](images/company/impact.jpg)](https://www.youtube.com/watch?v=ABC123&t=999s)
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_path = f.name
+        result = validate_case_study_format(md_file(content))
 
-        try:
-            result = validate_case_study_format(temp_path)
-
-            assert result.status == Severity.PASS
-            # Check that valid_timestamps check passed
-            assert any(c.name == "valid_timestamps" and c.passed for c in result.checks)
-        finally:
-            os.unlink(temp_path)
+        assert result.status == Severity.PASS
+        # Check that valid_timestamps check passed
+        assert any(c.name == "valid_timestamps" and c.passed for c in result.checks)
 
-    def test_no_screenshots_passes(self):
+    def test_no_screenshots_passes(self, md_file):
         """Test case study without screenshots passes (acceptable)."""
         content = """# Company Case Study
 
@@ -691,23 +524,16 @@ The company faced many challenges with their infrastructure.
 
 They implemented cloud native technologies.
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_path = f.name
-
-        try:
-            result = validate_case_study_format(temp_path)
-
-            assert result.status == Severity.PASS
-            # Check that it handled no screenshots gracefully
-            assert any(
-                c.name == "clickable_screenshot_links"
-                and "no screenshots" in c.message.lower()
-                for c in result.checks
-                if c.message
-            )
-        finally:
-            os.unlink(temp_path)
+        result = validate_case_study_format(md_file(content))
+
+        assert result.status == Severity.PASS
+        # Check that it handled no screenshots gracefully
+        assert any(
+            c.name == "clickable_screenshot_links"
+            and "no screenshots" in c.message.lower()
+            for c in result.checks
+            if c.message
+        )
 
     def test_missing_file_fails(self):
         """Test validation of non-existent file fails critically."""
@@ -717,11 +543,11 @@ They implemented cloud native technologies.
         assert result.is_critical()
         assert any(
             c.name == "file_exists" and "not found" in c.message.lower()
-            for c in result.get_failed_checks()
-            if c.message
+            for c in result.checks
+            if not c.passed and c.message
         )
 
-    def test_combined_issues_multiple_failures(self):
+    def test_combined_issues_multiple_failures(self, md_file):
         """Test case study with multiple format issues reports all failures."""
         content = """# Company Case Study
 
@@ -734,28 +560,19 @@ They implemented cloud native technologies.
 
 Some content here.
 """
-        with tempfile.NamedTemporaryFile(mode="w", suffix=".md", delete=False) as f:
-            f.write(content)
-            temp_path = f.name
+        result = validate_case_study_format(md_file(content))
 
-        try:
-            result = validate_case_study_format(temp_path)
-
-            assert result.status == Severity.CRITICAL
-            failed = result.get_failed_checks()
+        assert result.status == Severity.CRITICAL
 
-            # Should have both failures
-            assert len(failed) >= 2
-            assert any(c.name == "relative_image_paths" for c in failed)
-            assert any(c.name == "clickable_screenshot_links" for c in failed)
-        finally:
-            os.unlink(temp_path)
+        # Should have both failures
+        assert sum(1 for c in result.checks if not c.passed) >= 2
+        assert any(c.name == "relative_image_paths" and not c.passed for c in result.checks)
+        assert any(c.name == "clickable_screenshot_links" and not c.passed for c in result.checks)
 
 class TestFromChecks:
     """Tests for ValidationResult.from_checks classmethod."""
 
     def test_all_passing(self):
-        from casestudypilot.validation import ValidationResult, ValidationCheck, Severity
         checks = [
             ValidationCheck(name="a", passed=True, severity=Severity.PASS),
             ValidationCheck(name="b", passed=True, severity=Severity.PASS),
@@ -764,7 +581,6 @@ class TestFromChecks:
         assert result.status == Severity.PASS
 
     def test_warning_sets_warning(self):
-        from casestudypilot.validation import ValidationResult, ValidationCheck, Severity
         checks = [
             ValidationCheck(name="a", passed=True, severity=Severity.PASS),
             ValidationCheck(name="b", passed=False, severity=Severity.WARNING, message="warn"),
@@ -773,7 +589,6 @@ class TestFromChecks:
         assert result.status == Severity.WARNING
 
     def test_critical_overrides_warning(self):
-        from casestudypilot.validation import ValidationResult, ValidationCheck, Severity
         checks = [
             ValidationCheck(name="a", passed=False, severity=Severity.WARNING, message="warn"),
             ValidationCheck(name="b", passed=False, severity=Severity.CRITICAL, message="crit"),
@@ -782,6 +597,5 @@ class TestFromChecks:
         assert result.status == Severity.CRITICAL
 
     def test_empty_checks(self):
-        from casestudypilot.validation import ValidationResult, Severity
         result = ValidationResult.from_checks([])
         assert result.status == Severity.PASS